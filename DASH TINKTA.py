@@ -26,10 +26,22 @@ import gc
 import time
 from functools import wraps
 import hashlib
+import importlib.util
 from pathlib import Path
 from matplotlib.widgets import RectangleSelector
 import matplotlib.transforms as transforms
 
+# orjson parses and emits JSON in compiled code; config and API responses fall back to the json module without it
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pyarrow enables Parquet export (columnar and compressed); CSV remains the default. Only
+# locate it here, pandas imports it when a Parquet file is actually written
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -70,9 +82,13 @@ class ConfigManager:
     def load_config(self):
         """Load configuration from file"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    return json.load(f)
+            if HAS_ORJSON:
+                with open(self.config_file, 'rb') as f:
+                    return orjson.loads(f.read())
+            with open(self.config_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"Could not load config: {e}")
         return self.get_default_config()
@@ -102,8 +118,12 @@ class ConfigManager:
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            if HAS_ORJSON:
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.config_file, 'w') as f:
+                    json.dump(self.config, f, indent=2)
         except Exception as e:
             logger.error(f"Could not save config: {e}")
 
@@ -211,6 +231,13 @@ class ODKDataManager:
         key_string = f"{url}_{project_id}_{form_id}_{datetime.now().strftime('%Y%m%d')}"
         return hashlib.md5(key_string.encode()).hexdigest()
     
+    @staticmethod
+    def parse_json(response):
+        """Decode a JSON API response, with orjson when it is installed"""
+        if HAS_ORJSON:
+            return orjson.loads(response.content)
+        return response.json()
+    
     def fetch_submissions_with_all_columns(self, base_url, project_id, form_id, auth, use_cache=True):
         """Fetch submissions ensuring all form columns are included"""
         cache_key = self.generate_cache_key(base_url, project_id, form_id)
@@ -241,7 +268,7 @@ class ODKDataManager:
             submissions_url = f"{base_url}/v1/projects/{project_id}/forms/{form_id}/submissions"
             response = self.safe_api_call(submissions_url, auth, timeout=30)
             
-            submissions = response.json()
+            submissions = self.parse_json(response)
             if not submissions:
                 return pd.DataFrame(), "Empty Response"
             
@@ -254,7 +281,7 @@ class ODKDataManager:
                         submission_url = f"{base_url}/v1/projects/{project_id}/forms/{form_id}/submissions/{instance_id}"
                         sub_response = self.safe_api_call(submission_url, auth, timeout=30)
                         if sub_response.status_code == 200:
-                            full_data = sub_response.json()
+                            full_data = self.parse_json(sub_response)
                             full_submissions.append(full_data)
                     except Exception as e:
                         logger.warning(f"Failed to fetch individual submission {instance_id}: {e}")
@@ -273,7 +300,7 @@ class ODKDataManager:
             submissions_url = f"{base_url}/v1/projects/{project_id}/forms/{form_id}/submissions"
             response = self.safe_api_call(submissions_url, auth, timeout=30)
             
-            data = response.json()
+            data = self.parse_json(response)
             if not data:
                 return pd.DataFrame(), "No Data"
             
@@ -1313,21 +1340,20 @@ class Dashboard:
     def load_xlsform_data(self, filename):
         """Load survey and choices data from XLSForm file"""
         try:
-            # Read Excel file with multiple sheets
-            excel_file = pd.ExcelFile(filename)
-            
-            # Load survey sheet
-            if 'survey' in excel_file.sheet_names:
-                self.survey_sheet = pd.read_excel(filename, sheet_name='survey')
-                logger.info(f"Loaded survey sheet with {len(self.survey_sheet)} rows")
-            else:
-                messagebox.showwarning("Warning", "No 'survey' sheet found in the file")
-                return
-            
-            # Load choices sheet
-            if 'choices' in excel_file.sheet_names:
-                self.choices_sheet = pd.read_excel(filename, sheet_name='choices')
-                logger.info(f"Loaded choices sheet with {len(self.choices_sheet)} rows")
+            # Open the workbook once and parse both sheets from the same handle
+            with pd.ExcelFile(filename) as excel_file:
+                # Load survey sheet
+                if 'survey' in excel_file.sheet_names:
+                    self.survey_sheet = excel_file.parse('survey')
+                    logger.info(f"Loaded survey sheet with {len(self.survey_sheet)} rows")
+                else:
+                    messagebox.showwarning("Warning", "No 'survey' sheet found in the file")
+                    return
+                
+                # Load choices sheet
+                if 'choices' in excel_file.sheet_names:
+                    self.choices_sheet = excel_file.parse('choices')
+                    logger.info(f"Loaded choices sheet with {len(self.choices_sheet)} rows")
             
             # Process the loaded data
             self.process_xlsform_data()
@@ -1408,7 +1434,7 @@ class Dashboard:
             form_url = f"{base_url}/v1/projects/{project_id}/forms/{form_id}"
             response = self.odk_manager.safe_api_call(form_url, auth, timeout=30)
             
-            form_data = response.json()
+            form_data = self.odk_manager.parse_json(response)
             self.form_schema = form_data
             
             # Try to get the XLSForm source file
@@ -2373,10 +2399,13 @@ class Dashboard:
                           variable=export_type, value="choices").pack(pady=5)
             
             def do_export():
+                filetypes = [("CSV files", "*.csv")]
+                if HAS_PYARROW:
+                    filetypes.append(("Parquet files", "*.parquet"))
                 filename = filedialog.asksaveasfilename(
                     defaultextension=".csv",
-                    filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-                    title="Save data as CSV"
+                    filetypes=filetypes + [("All files", "*.*")],
+                    title="Export data"
                 )
                 
                 if filename:
@@ -2419,7 +2448,10 @@ class Dashboard:
                         
                         export_df = export_df.rename(columns=new_columns)
                     
-                    export_df.to_csv(filename, index=False)
+                    if HAS_PYARROW and filename.lower().endswith('.parquet'):
+                        export_df.to_parquet(filename, index=False, compression='snappy')
+                    else:
+                        export_df.to_csv(filename, index=False)
                     messagebox.showinfo("Success", f"Data exported to {filename}")
                 
                 export_window.destroy()
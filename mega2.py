@@ -1,6 +1,7 @@
 import pandas as pd
 import requests
 import threading
+import socket
 import webbrowser
 import logging
 from shiny import debounce
@@ -9,6 +10,7 @@ import seaborn as sns
 from palmerpenguins import load_penguins
 import time
 from datetime import datetime
+from itertools import islice
 from shiny import App, ui, render, reactive, Session
 from shinywidgets import output_widget, render_widget
 from ipyleaflet import Map, Marker, MarkerCluster, Popup, basemaps, CircleMarker, Icon, AwesomeIcon, TileLayer
@@ -143,16 +145,11 @@ class ODKCentralAPI:
             # Use streaming for better performance with large datasets
             with requests.get(url, headers=headers, timeout=60, stream=True) as response:
                 response.raise_for_status()
-                from io import StringIO
-            
-               # Read in chunks to avoid memory issues
-                csv_data = StringIO()
-                for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
-                    if chunk:
-                        csv_data.write(chunk)
                 
-                csv_data.seek(0)
-                df = pd.read_csv(csv_data)
+                # Parse straight from the response stream so the CSV text is never held in memory
+                # alongside the DataFrame; decode_content undoes any gzip/deflate transfer encoding
+                response.raw.decode_content = True
+                df = pd.read_csv(response.raw, encoding="utf-8")
                 
                 # Cache the results
                 self._submissions_cache[cache_key] = df
@@ -1326,6 +1323,7 @@ def server(input, output, session: Session):
                       )
                   columns = list(data.columns)
                   total_columns = len(columns)
+                  default_columns = set(islice(columns, 6))
                   
                   # FIXED DROPDOWN COLUMN SELECTOR WITH SEARCH AND SELECT ALL/NONE FUNCTIONALITY
                   column_selector = ui.div(
@@ -1412,7 +1410,7 @@ def server(input, output, session: Session):
                                               "type": "checkbox", 
                                               "id": f"col_{i}", 
                                               "class": "form-check-input column-checkbox",
-                                              "checked": "checked" if col in columns[:min(len(columns), 6)] else None,
+                                              "checked": "checked" if col in default_columns else None,
                                               "onchange": "updateDropdownCounter();"
                                           }),
                                           ui.tags.label(col, {"class": "form-check-label ms-2", "for": f"col_{i}"})
@@ -1746,21 +1744,30 @@ def server(input, output, session: Session):
               )
           )
       
-      # Download function
-      @output
-      @render.download(filename="Botnar_Adolescent_2.csv")
-      def download_data():
+      # CSV export of the current filter/column selection. Kept as a calc so repeated downloads
+      # reuse the encoded bytes until the data, filters or selected columns change
+      @reactive.Calc
+      def download_csv():
           df = filtered_df()
           selected = selected_columns()
           from io import StringIO
           buffer = StringIO()
+          cols_to_download = None
           if df is not None and not df.empty and selected:
               cols_to_download = [col for col in selected if col in df.columns] if selected else list(df.columns)
               df[cols_to_download].to_csv(buffer, index=False)
-              log_audit_event("Download Data", odk_email_value.get(), f"Cols: {cols_to_download}")
           else:
               buffer.write("No data loaded\n")
-          yield buffer.getvalue().encode("utf-8")
+          return buffer.getvalue().encode("utf-8"), cols_to_download
+  
+      # Download function
+      @output
+      @render.download(filename="Botnar_Adolescent_2.csv")
+      def download_data():
+          csv_bytes, cols_to_download = download_csv()
+          if cols_to_download is not None:
+              log_audit_event("Download Data", odk_email_value.get(), f"Cols: {cols_to_download}")
+          yield csv_bytes
   
       @reactive.Effect
       @reactive.event(input.login)
@@ -2068,13 +2075,13 @@ def server(input, output, session: Session):
                       
               if not selected:
                   # Default to first 6 columns if nothing is selected
-                  return list(df.columns)[:min(len(df.columns),6)]
+                  return list(islice(df.columns, 6))
                   
               return selected
             
             except Exception as e:
                 logging.error(f"Error in selected_columns: {str(e)}")
-                return list(df.columns)[:min(len(df.columns),6)]
+                return list(islice(df.columns, 6))
   
       # New effect to update the button text
       @reactive.Effect
@@ -2260,11 +2267,12 @@ def server(input, output, session: Session):
               )
               
               # Add percentage annotations above each bar
-              for i, row in age_counts.iterrows():
+              for age_group, count, percentage in zip(age_counts["Age Group"], age_counts["Count"],
+                                                      age_counts["Percentage"]):
                   fig.add_annotation(
-                      x=row["Age Group"],
-                      y=row["Count"],
-                      text=f"{row['Percentage']}%",
+                      x=age_group,
+                      y=count,
+                      text=f"{percentage}%",
                       showarrow=False,
                       yshift=15,
                       font=dict(size=12, color='rgba(106, 27, 154, 0.8)', family="Arial Black")
@@ -2460,26 +2468,28 @@ def server(input, output, session: Session):
                   # Create markers for each location
                   markers = []
                   
-                  for idx, row in map_df.iterrows():
-                      # Create popup content with available information
-                      popup_content = "<div class='marker-popup-content'>"
+                  # Plain dict rows: iterrows() would box every row into a Series
+                  for row in map_df.to_dict('records'):
+                      # Create popup content with available information (joined once at the end)
+                      popup_parts = ["<div class='marker-popup-content'>"]
                       
                       if "school" in row:
-                          popup_content += f"<h4>{row['school']}</h4>"
+                          popup_parts.append(f"<h4>{row['school']}</h4>")
                       
                       if "sample" in row:
-                          popup_content += f"<div><strong>Sample:</strong> {row['sample']}</div>"
+                          popup_parts.append(f"<div><strong>Sample:</strong> {row['sample']}</div>")
                       
                       if "A04" in row:  # Sex information
-                          popup_content += f"<div><strong>Sex:</strong> {row['A04']}</div>"
+                          popup_parts.append(f"<div><strong>Sex:</strong> {row['A04']}</div>")
                       
                       if "age_group" in row:
-                          popup_content += f"<div><strong>Age Group:</strong> {row['age_group']}</div>"
+                          popup_parts.append(f"<div><strong>Age Group:</strong> {row['age_group']}</div>")
                           
                       # Add GPS coordinates to popup
-                      popup_content += f"<div><strong>Coordinates:</strong> {row[lat_col]}, {row[lon_col]}</div>"
+                      popup_parts.append(f"<div><strong>Coordinates:</strong> {row[lat_col]}, {row[lon_col]}</div>")
                           
-                      popup_content += "</div>"
+                      popup_parts.append("</div>")
+                      popup_content = "".join(popup_parts)
                       
                       # Create marker with popup
                       marker_color = 'blue'
@@ -2550,8 +2560,7 @@ def server(input, output, session: Session):
                       # Drop rows with missing coordinates
                       valid_coords = map_df.dropna(subset=["latitude", "longitude"])
                       
-                      for idx, row in valid_coords.iterrows():
-                          coordinates.append((idx, row["latitude"], row["longitude"]))
+                      coordinates.extend(zip(valid_coords.index, valid_coords["latitude"], valid_coords["longitude"]))
                       
                       if coordinates:
                           break
@@ -2565,8 +2574,8 @@ def server(input, output, session: Session):
                       map_df["latitude"] = None
                       map_df["longitude"] = None
                       
-                      for idx, row in map_df.iterrows():
-                          lat, lon = extract_lat_lon(row[col])
+                      for idx, gps_value in zip(map_df.index, map_df[col].tolist()):
+                          lat, lon = extract_lat_lon(gps_value)
                           if lat is not None and lon is not None:
                               map_df.at[idx, "latitude"] = lat
                               map_df.at[idx, "longitude"] = lon
@@ -2591,25 +2600,26 @@ def server(input, output, session: Session):
                   for idx, lat, lon in coordinates:
                       row = map_df.iloc[idx]
                       
-                      # Create popup content with available information
-                      popup_content = "<div class='marker-popup-content'>"
+                      # Create popup content with available information (joined once at the end)
+                      popup_parts = ["<div class='marker-popup-content'>"]
                       
                       if "school" in row:
-                          popup_content += f"<h4>{row['school']}</h4>"
+                          popup_parts.append(f"<h4>{row['school']}</h4>")
                       
                       if "sample" in row:
-                          popup_content += f"<div><strong>Sample:</strong> {row['sample']}</div>"
+                          popup_parts.append(f"<div><strong>Sample:</strong> {row['sample']}</div>")
                       
                       if "A04" in row:  # Sex information
-                          popup_content += f"<div><strong>Sex:</strong> {row['A04']}</div>"
+                          popup_parts.append(f"<div><strong>Sex:</strong> {row['A04']}</div>")
                       
                       if "age_group" in row:
-                          popup_content += f"<div><strong>Age Group:</strong> {row['age_group']}</div>"
+                          popup_parts.append(f"<div><strong>Age Group:</strong> {row['age_group']}</div>")
                           
                       # Add GPS coordinates to popup
-                      popup_content += f"<div><strong>Coordinates:</strong> {lat}, {lon}</div>"
+                      popup_parts.append(f"<div><strong>Coordinates:</strong> {lat}, {lon}</div>")
                           
-                      popup_content += "</div>"
+                      popup_parts.append("</div>")
+                      popup_content = "".join(popup_parts)
                       
                       # Create marker with popup
                       marker_color = 'blue'
@@ -2756,10 +2766,21 @@ def open_browser():
         print(f"Could not open browser automatically: {e}")
         print(f"Please open your browser and go to {url}")
 
+def open_browser_when_ready(host="127.0.0.1", port=8000, timeout=5.0):
+    """Open the browser as soon as the server accepts connections, polling every 50 ms."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex((host, port)) == 0:
+                break
+        time.sleep(0.05)
+    # Open anyway after the timeout; the page will load once the server is up
+    open_browser()
+
 def start_app():
     app = App(app_ui, server)
     print("Starting Shiny app on http://127.0.0.1:8000 ...")
-    threading.Timer(2.0, open_browser).start()
+    threading.Thread(target=open_browser_when_ready, daemon=True).start()
     app.run(host="127.0.0.1", port=8000)
 
 if __name__ == "__main__":
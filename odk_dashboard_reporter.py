@@ -1,50 +1,115 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from collections import deque, OrderedDict
 import os
 import sys
+import platform
+import subprocess
+import traceback
+import base64
 import tempfile
 import zipfile
 import io
 import atexit
+import getpass
+import queue
 from typing import Dict, List, Optional, Any
 from urllib.parse import urljoin, quote, unquote
-import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
 import requests
 import json
 import logging
+import logging.handlers
 import re
-from PIL import Image as PILImage, ImageTk, ImageOps
+import struct
+import importlib.metadata
+import importlib.util
+import threading
+import time
+import hashlib
+import functools
+from PIL import Image as PILImage, ImageOps
 
-# Handle imports with fallbacks
-try:
-    import yaml
-    HAS_YAML = True
-except ImportError:
-    HAS_YAML = False
+# tkinter (and PIL's ImageTk, which imports it) is only needed by the GUI. main() calls
+# _load_tkinter() before building it, so headless CLI runs never load Tcl/Tk
+tk = ttk = messagebox = filedialog = ImageTk = None
 
-try:
+
+@functools.lru_cache(maxsize=1)
+def _load_tkinter():
+    """Import tkinter once, binding the module-level tk, ttk, messagebox, filedialog and ImageTk."""
+    global tk, ttk, messagebox, filedialog, ImageTk
+    import tkinter as tk
+    from tkinter import ttk, messagebox, filedialog
+    from PIL import ImageTk
+
+class LazyImportTester:
+    """Truthy if an optional module is installed, without importing it.
+    
+    The check is a cached importlib.util.find_spec lookup, so `if HAS_X:` stays cheap on every
+    call; the module itself is imported by the code that first needs it (see require_now).
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self._available = None
+    
+    def __bool__(self) -> bool:
+        if self._available is None:
+            try:
+                self._available = importlib.util.find_spec(self.name) is not None
+            except (ImportError, ValueError):
+                self._available = False
+        return self._available
+    
+    def require_now(self):
+        """Import and return the module, raising ImportError if it is not installed."""
+        if not self:
+            raise ImportError(f"{self.name} is not installed")
+        return importlib.import_module(self.name)
+    
+    def __repr__(self):
+        return f"LazyImportTester({self.name!r})"
+
+
+# pandas and numpy are required but only imported by _load_pandas; check_dependencies reports them
+HAS_PANDAS = LazyImportTester('pandas')
+HAS_NUMPY = LazyImportTester('numpy')
+
+# Optional dependencies are only located here; each is imported the first time its feature is used
+HAS_YAML = LazyImportTester('yaml')
+HAS_TQDM = LazyImportTester('tqdm')
+HAS_MATPLOTLIB = LazyImportTester('matplotlib')
+HAS_REPORTLAB = LazyImportTester('reportlab')
+HAS_FOLIUM = LazyImportTester('folium')
+
+# Bound by _load_matplotlib() the first time a chart is actually drawn
+mdates = None
+Figure = None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_matplotlib():
+    """Import and configure matplotlib once, binding the module-level mdates and Figure."""
+    global mdates, Figure
     import matplotlib
     matplotlib.use('Agg')  # Use non-interactive backend
-    import matplotlib.pyplot as plt
+    import matplotlib.style
     import matplotlib.dates as mdates
-    import seaborn as sns
-    import numpy as np
-    import pandas as pd
+    from matplotlib.figure import Figure
     
     # Set style
-    plt.style.use('default')
-    plt.rcParams['figure.facecolor'] = 'white'
-    plt.rcParams['axes.facecolor'] = 'white'
-    plt.rcParams['font.size'] = 12
-    
-    HAS_MATPLOTLIB = True
-except ImportError:
-    HAS_MATPLOTLIB = False
+    matplotlib.style.use('default')
+    matplotlib.rcParams['figure.facecolor'] = 'white'
+    matplotlib.rcParams['axes.facecolor'] = 'white'
+    matplotlib.rcParams['font.size'] = 12
 
-try:
+
+@functools.lru_cache(maxsize=1)
+def _load_reportlab():
+    """Import the ReportLab names the PDF reporter uses, binding them as module globals."""
+    global letter, A4, SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak
+    global getSampleStyleSheet, ParagraphStyle, inch, colors, TA_CENTER, TA_LEFT, TA_RIGHT, ImageReader
     from reportlab.lib.pagesizes import letter, A4
     from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle, PageBreak
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -52,34 +117,104 @@ try:
     from reportlab.lib import colors
     from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
     from reportlab.lib.utils import ImageReader
-    import numpy as np
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-    HAS_REPORTLAB = True
-except ImportError:
-    HAS_REPORTLAB = False
 
-try:
-    from tqdm import tqdm
-    HAS_TQDM = True
-except ImportError:
-    HAS_TQDM = False
-    class tqdm:
-        def __init__(self, desc="Progress", unit="B", unit_scale=True):
-            self.desc = desc
-        def update(self, n): pass
-        def __enter__(self): return self
-        def __exit__(self, *args): pass
+# The matplotlib Tk backend is only needed for the GUI chart preview; it is
+# imported on first use by FixedODKDashboardGUI._build_chart_preview
+FigureCanvasTkAgg = None
+NavigationToolbar2Tk = None
 
-try:
+folium = None
+MarkerCluster = None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_folium():
+    """Import folium on the first map, binding the module-level folium and MarkerCluster."""
+    global folium, MarkerCluster
     import folium
     from folium.plugins import MarkerCluster
-    HAS_FOLIUM = True
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+    _TURBO_JPEG = TurboJPEG()  # Loads libjpeg-turbo; raises if the shared library is missing
+    HAS_TURBOJPEG = True
+except (ImportError, OSError, RuntimeError):
+    HAS_TURBOJPEG = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
 except ImportError:
-    HAS_FOLIUM = False
+    HAS_ORJSON = False
+
+@functools.lru_cache(maxsize=1)
+def _current_user() -> str:
+    """Login name of the current user, looked up once.
+    
+    os.getlogin() needs a controlling terminal and raises under cron/systemd; getpass.getuser()
+    falls back to the environment there.
+    """
+    try:
+        return os.getlogin()
+    except OSError:
+        return getpass.getuser()
+
 
 # Updated constants with current values
-CURRENT_USER = os.getlogin()
-CURRENT_DATETIME = "2025-08-15 07:33:14"  # Using the provided date/time
+CURRENT_USER = _current_user()
+
+
+def current_datetime_str() -> str:
+    """Current date/time as shown in banners and report stamps, formatted when displayed."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+# pandas and numpy are a large share of start-up that --help and the dependency report never need.
+# _load_pandas() binds them before any data work: main(), cli_mode() and the constructors of the
+# classes that take or produce DataFrames all call it
+pd = None
+np = None
+# Weekday names indexed by datetime.weekday() (Monday == 0), built as a numpy array by _load_pandas()
+_WEEKDAY_NAMES = None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pandas():
+    """Import pandas and numpy once, binding the module-level pd, np and _WEEKDAY_NAMES."""
+    global pd, np, _WEEKDAY_NAMES
+    import pandas as pd
+    import numpy as np
+    _WEEKDAY_NAMES = np.array(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+
+# Submission metadata columns never offered as visualization variables (compared lower-case)
+_EXCLUDED_VARIABLE_COLUMNS = frozenset({'submissiondate', 'instanceid', 'deviceid', 'submission_date'})
+
+# Column names that suggest geographic data (same substrings the report actions used to test one by one)
+_GEO_COLUMN_RE = re.compile(r'geopoint|lat|lon|lng', re.IGNORECASE)
+
+# Latitude/longitude name candidates for the report map section ('latitude', '_lat' contain 'lat';
+# 'long', 'longitude', '_lon' contain 'lon'), so one search replaces a scan over each term
+_LAT_COLUMN_RE = re.compile(r'lat', re.IGNORECASE)
+_LON_COLUMN_RE = re.compile(r'lon|lng', re.IGNORECASE)
+
+# MapHandler's looser fallback patterns, including projected (northing/easting) and x/y columns
+_MAP_LAT_COLUMN_RE = re.compile(r'lat|y|northing', re.IGNORECASE)
+_MAP_LON_COLUMN_RE = re.compile(r'lon|lng|x|easting', re.IGNORECASE)
+_ODK_GEOPOINT_COLUMN_RE = re.compile(r'geopoint|coordinates', re.IGNORECASE)
+
+# Characters not allowed in report file names built from a form ID
+_FORM_ID_SANITIZE = re.compile(r'[^\w\-_.]')
+
+# Chart types offered in the Custom Visualization dropdown
+_CHART_TYPES = ("Horizontal Bar Chart", "Vertical Bar Chart", "Pie Chart",
+                "Line Chart", "Area Chart", "Count Plot")
+
+# Host platform (fixed for the life of the process) and the command that opens a file with its
+# default application; None means os.startfile (Windows), unknown systems fall back to xdg-open
+_PLATFORM = platform.system()
+_OPEN_CMD = {'Windows': None, 'Darwin': ['open'], 'Linux': ['xdg-open']}
+
+# Banners and ANSI colours are only for interactive terminals; piped/captured output gets plain text
+_STDOUT_IS_TTY = sys.stdout is not None and sys.stdout.isatty()
 
 # Global list to track temporary files for cleanup
 _temp_files_to_cleanup = []
@@ -101,7 +236,7 @@ def cleanup_temp_files():
             logging.warning(f"Could not clean up temp file {temp_path}: {e}")
     _temp_files_to_cleanup.clear()
 
-# Register cleanup function
+# Register cleanup function; this is the single shutdown cleanup for every exit path
 atexit.register(cleanup_temp_files)
 
 # ============================================================================
@@ -184,7 +319,7 @@ class HighQualityImageProcessor:
             temp_dir = tempfile.mkdtemp(prefix='odk_hq_img_', suffix='_persist')
             
             # Get image info
-            img_info = HighQualityImageProcessor.get_image_info(image_path)
+            img_info = _cached_image_info(image_path)
             original_format = img_info.get('format', 'UNKNOWN')
             
             logging.info(f"Processing image: {Path(image_path).name}")
@@ -281,32 +416,133 @@ class HighQualityImageProcessor:
         except Exception:
             return (0, 0)
     
+    @staticmethod
+    def get_png_size(image_path: str) -> Optional[tuple]:
+        """Read PNG pixel dimensions straight from the IHDR header without decoding the image."""
+        try:
+            with open(image_path, 'rb') as f:
+                header = f.read(24)
+            if len(header) < 24 or header[:8] != b'\x89PNG\r\n\x1a\n':
+                return None
+            return struct.unpack('>II', header[16:24])
+        except OSError:
+            return None
+    
+    @staticmethod
+    def encode_jpeg_for_pdf(image_path: str, width_inches: float, height_inches: float,
+                            dpi: int = 150, quality: int = 80) -> Optional[io.BytesIO]:
+        """
+        Re-encode an image as an in-memory JPEG at its final embed size.
+        
+        ReportLab embeds PNGs losslessly and writes rasters verbatim, so images such as
+        the map are far smaller in the PDF (and in memory while building it) when passed
+        as a JPEG already downscaled to the size they are drawn at.
+        
+        Args:
+            image_path: Path to source image
+            width_inches: Width the image is drawn at in the PDF
+            height_inches: Height the image is drawn at in the PDF
+            dpi: Raster resolution (150 for print, 100 for draft)
+            quality: JPEG quality
+        
+        Returns:
+            BytesIO positioned at the start of the JPEG data, or None if failed
+        """
+        try:
+            target_px = (max(1, int(width_inches * dpi)), max(1, int(height_inches * dpi)))
+            
+            with PILImage.open(image_path) as img:
+                img = img.convert('RGB')
+                # thumbnail() downscales in place and never enlarges
+                img.thumbnail(target_px, PILImage.Resampling.LANCZOS)
+                
+                if HAS_TURBOJPEG:
+                    # libjpeg-turbo's SIMD encoder, with 4:2:0 chroma subsampling
+                    buffer = io.BytesIO(_TURBO_JPEG.encode(
+                        np.asarray(img), quality=quality,
+                        pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420
+                    ))
+                else:
+                    buffer = io.BytesIO()
+                    img.save(buffer, format='JPEG', quality=quality, optimize=True, progressive=True)
+            
+            buffer.seek(0)
+            return buffer
+        except Exception as e:
+            logging.error(f"Error encoding JPEG for PDF: {e}")
+            return None
+    
     @staticmethod
     def create_preview_image(image_path: str, max_size: tuple = (300, 150)) -> Optional[PILImage.Image]:
         """Create a preview image for GUI display."""
         try:
-            with PILImage.open(image_path) as img:
+            with PILImage.open(image_path) as source:
+                img = source
+                # Let JPEG decode at a reduced scale instead of at full camera resolution
+                img.draft('RGB', (max_size[0] * 2, max_size[1] * 2))
+                if img.mode == 'P' and 'transparency' in img.info:
+                    img = img.convert('RGBA')
+                
+                # Calculate preview size before compositing so only the small image is processed
+                img.thumbnail(max_size, PILImage.Resampling.LANCZOS, reducing_gap=2.0)
+                
                 # Handle transparency for preview
                 if img.mode in ('RGBA', 'LA', 'P'):
                     # Create white background for preview
                     background = PILImage.new('RGB', img.size, (255, 255, 255))
                     if img.mode == 'RGBA':
                         background.paste(img, mask=img.split()[-1])
-                    elif img.mode == 'P' and 'transparency' in img.info:
-                        img = img.convert('RGBA')
-                        background.paste(img, mask=img.split()[-1])
                     else:
                         background.paste(img)
                     img = background
                 
-                # Calculate preview size
-                img.thumbnail(max_size, PILImage.Resampling.LANCZOS)
-                return img.copy()
+                # Only the file-backed image needs detaching before the file is closed
+                return img.copy() if img is source else img
                 
         except Exception as e:
             logging.error(f"Error creating preview: {e}")
             return None
 
+
+# The GUI asks about the same header image from several places; these memoize the answers per
+# file version so an unchanged file is opened only once.
+
+@functools.lru_cache(maxsize=64)
+def _image_info_for_version(image_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    return HighQualityImageProcessor.get_image_info(image_path)
+
+
+@functools.lru_cache(maxsize=64)
+def _image_valid_for_version(image_path: str, mtime_ns: int, size: int) -> bool:
+    return HighQualityImageProcessor.validate_image(image_path)
+
+
+def _safe_stat(path: str) -> Optional[os.stat_result]:
+    """os.stat(path), or None if the file is missing or unreadable.
+    
+    One stat answers existence, size and mtime, so callers should fetch it once and pass it on.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _cached_image_info(image_path: str, st: Optional[os.stat_result] = None) -> Dict[str, Any]:
+    """HighQualityImageProcessor.get_image_info, cached by path, mtime and size."""
+    st = st or _safe_stat(image_path)
+    if st is None:
+        return {}
+    return _image_info_for_version(image_path, st.st_mtime_ns, st.st_size)
+
+
+def _cached_validate_image(image_path: str, st: Optional[os.stat_result] = None) -> bool:
+    """HighQualityImageProcessor.validate_image, cached by path, mtime and size."""
+    st = st or _safe_stat(image_path)
+    if st is None:
+        return False
+    return _image_valid_for_version(image_path, st.st_mtime_ns, st.st_size)
+
 # ============================================================================
 # Map Handling for Geographic Data
 # ============================================================================
@@ -315,6 +551,7 @@ class MapHandler:
     """Handle map generation and display using OpenStreetMap via folium."""
     
     def __init__(self, debug=False):
+        _load_pandas()
         self.default_location = [-6.8235, 39.2695]  # Default location (e.g., Dar es Salaam)
         self.default_zoom = 7
         self.debug = debug
@@ -336,6 +573,7 @@ class MapHandler:
         """
         if not HAS_FOLIUM:
             return None
+        _load_folium()
         
         # Debug output if enabled
         if self.debug:
@@ -519,10 +757,6 @@ class MapHandler:
         lat_columns = []
         lon_columns = []
         
-        # Common patterns for latitude/longitude columns - expanded for better detection
-        lat_patterns = ['lat', 'latitude', '_lat', 'y', 'northing']
-        lon_patterns = ['lon', 'lng', 'long', 'longitude', '_lon', 'x', 'easting']
-        
         # Check for columns with exact matches first (highest confidence)
         for col in data.columns:
             col_lower = col.lower()
@@ -541,7 +775,7 @@ class MapHandler:
         
         # Look for ODK-style geopoint columns
         for col in data.columns:
-            if 'geopoint' in col.lower() or 'coordinates' in col.lower():
+            if _ODK_GEOPOINT_COLUMN_RE.search(col):
                 # Check if this column might contain coordinates
                 try:
                     sample = data[col].dropna().iloc[0] if not data[col].dropna().empty else None
@@ -562,12 +796,11 @@ class MapHandler:
         
         # Look for partial matches if no exact matches were found
         for col in data.columns:
-            col_lower = col.lower()
             # Check for latitude patterns
-            if any(pattern in col_lower for pattern in lat_patterns):
+            if _MAP_LAT_COLUMN_RE.search(col):
                 lat_columns.append(col)
             # Check for longitude patterns
-            if any(pattern in col_lower for pattern in lon_patterns):
+            if _MAP_LON_COLUMN_RE.search(col):
                 lon_columns.append(col)
         
         # If we have potential latitude/longitude columns
@@ -722,6 +955,7 @@ class ODKCentralClient:
     
     def __init__(self, base_url: str, username: str, password: str, 
                  project_id: Optional[int] = None):
+        _load_pandas()
         self.base_url = base_url.rstrip('/')
         self.username = username
         self.password = password
@@ -775,7 +1009,7 @@ class ODKCentralClient:
             logging.error(f"Failed to get forms: {e}")
             return []
     
-    def get_submissions(self, form_id: str, project_id: Optional[int] = None) -> pd.DataFrame:
+    def get_submissions(self, form_id: str, project_id: Optional[int] = None) -> 'pd.DataFrame':
         pid = project_id or self.project_id
         if not pid:
             return pd.DataFrame()
@@ -839,7 +1073,8 @@ class ODKCentralClient:
 class DashboardAnalytics:
     """Analytics engine for dashboard metrics."""
     
-    def __init__(self, data: pd.DataFrame, form_info: Dict = None):
+    def __init__(self, data: 'pd.DataFrame', form_info: Dict = None):
+        _load_pandas()
         self.data = data.copy() if not data.empty else pd.DataFrame()
         self.form_info = form_info or {}
         self.date_column = None
@@ -881,7 +1116,7 @@ class DashboardAnalytics:
         except Exception as e:
             logging.error(f"Error preparing data: {e}")
 
-    def get_daily_submissions(self) -> pd.DataFrame:
+    def get_daily_submissions(self) -> 'pd.DataFrame':
         """Get daily submission counts."""
         if self.date_column is None or self.data.empty:
             return pd.DataFrame()
@@ -900,8 +1135,10 @@ class DashboardAnalytics:
             return {}
         
         try:
-            self.data['weekday'] = self.data['submission_date'].dt.day_name()
-            weekly_counts = self.data.groupby('weekday').size()
+            # Group by a derived Series rather than adding a column, so report sections
+            # rendered on worker threads only ever read self.data
+            weekday = self.data['submission_date'].dt.day_name()
+            weekly_counts = self.data.groupby(weekday).size()
             
             weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
             weekly_counts = weekly_counts.reindex(weekday_order, fill_value=0)
@@ -970,15 +1207,22 @@ def get_recent_activity(self, days: int = 7) -> Dict[str, Any]:
 class FixedHighQualityDashboardPDFReporter:
     """Generate modern dashboard-style PDF reports with fixed high-quality header image support."""
     
+    # Rendered map rasters are reused across exports of unchanged data
+    MAP_CACHE_DIR = Path.home() / '.cache' / 'mega2' / 'maps'
+    MAP_CACHE_STYLE = {'size': (800, 500), 'dpi': 150, 'quality': 80, 'format': 'JPEG'}
+    MAP_CACHE_MAX_FILES = 50
+    
     def __init__(self, analytics: DashboardAnalytics, header_image_path: Optional[str] = None):
         if not HAS_REPORTLAB:
             raise ImportError("reportlab is required for PDF generation")
+        _load_reportlab()
         
         self.analytics = analytics
         self.header_image_path = header_image_path
         self.optimized_image_path = None  # Store optimized image path
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
+        self._static_paras = self._build_static_paragraphs()
     
     def _setup_custom_styles(self):
         """Setup modern dashboard styles."""
@@ -1027,10 +1271,46 @@ class FixedHighQualityDashboardPDFReporter:
         except Exception as e:
             logging.error(f"Error setting up styles: {e}")
     
+    def _build_static_paragraphs(self) -> Dict[str, Any]:
+        """Pre-build the fixed-text paragraphs of the map section so they are parsed only once."""
+        normal = self.styles['Normal']
+        return {
+            'map_header': Paragraph("🗺️ Geographic Distribution", self.styles['SectionHeader']),
+            'no_folium': Paragraph(
+                "Geographic visualization requires the folium library. "
+                "Please install it with: pip install folium",
+                normal
+            ),
+            'map_description': Paragraph(
+                "The map below shows the geographical distribution of data collection points. "
+                "Each marker represents a data collection location.",
+                normal
+            ),
+            'map_note': Paragraph(
+                "Note: An interactive version of this map is available in the HTML report.",
+                self.styles['Italic']
+            ),
+            'html_only': Paragraph(
+                "Geographic visualization is available in the HTML report version.",
+                normal
+            ),
+            'no_geo': Paragraph(
+                "No geographic data was detected in this dataset. "
+                "Geographic visualization requires latitude and longitude coordinates.",
+                normal
+            ),
+            'map_error': Paragraph(
+                "Error creating geographic visualization. This may be due to invalid coordinates or data format issues.",
+                normal
+            ),
+        }
+    
     def generate_dashboard_report(self, output_path: str, title: str = "ODK Central Dashboard Report") -> bool:
         """Generate comprehensive dashboard report with header image."""
         try:
             logging.info(f"PDF generation to: {output_path}")
+            if HAS_MATPLOTLIB:
+                _load_matplotlib()  # Before the chart workers start, so they never race the import
 ##########################################################################
             if hasattr(self.analytics, 'custom_charts') and self.analytics.custom_charts:
                 story.extend(self._create_custom_charts())
@@ -1039,7 +1319,7 @@ class FixedHighQualityDashboardPDFReporter:
             #doc.build(story)
 ##################################################################################
             # Pre-process header image if provided
-            if self.header_image_path and HighQualityImageProcessor.validate_image(self.header_image_path):
+            if self.header_image_path and _cached_validate_image(self.header_image_path):
                 logging.info("Pre-processing header image...")
                 self.optimized_image_path = HighQualityImageProcessor.optimize_image_for_pdf(
                     self.header_image_path, 
@@ -1057,31 +1337,40 @@ class FixedHighQualityDashboardPDFReporter:
                 topMargin=50,
                 bottomMargin=50
             )
+            # Release each image's raster as soon as it is drawn instead of at the end of build()
+            doc.afterFlowable = self._release_drawn_image
             
             story = []
             
-            # High-quality header image (using pre-processed image)
-            if self.optimized_image_path:
-                story.extend(self._create_fixed_header_image())
-            
-            # Title and header
-            story.extend(self._create_dashboard_header(title))
-            
-            # Trend Analysis (positioned early)
-            story.extend(self._create_trend_analysis())
-            
-            # Key metrics overview
-            story.extend(self._create_metrics_overview())
-            
-            # Daily submissions table
-            story.extend(self._create_submissions_table())
-            
-            # Visualizations
-            if HAS_MATPLOTLIB:
-                story.extend(self._create_dashboard_charts())
-            
-            # Geographic visualization (if geopoint data available)
-            story.extend(self._create_map_visualization())
+            # Render charts and map in the background while the text sections are built;
+            # results are collected below in story order
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                daily_future = executor.submit(self._create_modern_daily_chart) if HAS_MATPLOTLIB else None
+                weekly_future = executor.submit(self._create_weekly_pattern_chart) if HAS_MATPLOTLIB else None
+                map_future = executor.submit(self._create_map_visualization)
+                
+                # High-quality header image (using pre-processed image)
+                if self.optimized_image_path:
+                    story.extend(self._create_fixed_header_image())
+                
+                # Title and header
+                story.extend(self._create_dashboard_header(title))
+                
+                # Trend Analysis (positioned early)
+                story.extend(self._create_trend_analysis())
+                
+                # Key metrics overview
+                story.extend(self._create_metrics_overview())
+                
+                # Daily submissions table
+                story.extend(self._create_submissions_table())
+                
+                # Visualizations
+                if HAS_MATPLOTLIB:
+                    story.extend(self._create_dashboard_charts(daily_future.result(), weekly_future.result()))
+                
+                # Geographic visualization (if geopoint data available)
+                story.extend(map_future.result())
             
             # Build the PDF
             doc.build(story)
@@ -1094,13 +1383,19 @@ class FixedHighQualityDashboardPDFReporter:
             return True
             
         except Exception as e:
-            logging.error(f"Failed to generate dashboard report: {e}")
-            import traceback
-            logging.error(f"Full error: {traceback.format_exc()}")
+            logging.error(f"Failed to generate dashboard report: {e}", exc_info=True)
             # Clean up temp files on error too
             cleanup_temp_files()
             return False
     
+    @staticmethod
+    def _release_drawn_image(flowable):
+        """afterFlowable hook: drop an Image's pixel data and source buffer once it is on the canvas."""
+        if isinstance(flowable, Image):
+            flowable._img = None
+            flowable._file = None
+            flowable.filename = None
+    
     def generate_html_report(self, output_path: str, title: str = "ODK Central Dashboard Report") -> bool:
         """Generate an HTML report with interactive maps."""
         try:
@@ -1162,7 +1457,7 @@ class FixedHighQualityDashboardPDFReporter:
                 html_parts.append(f"<p><strong>Form:</strong> {form_name} (ID: {form_id})</p>")
             
             # Basic info
-            html_parts.append(f"<p>Created on {CURRENT_DATETIME} UTC</p>")
+            html_parts.append(f"<p>Created on {current_datetime_str()} UTC</p>")
             html_parts.append(f"<p>Created by: {CURRENT_USER}</p>")
             
             # Metrics overview
@@ -1194,21 +1489,8 @@ class FixedHighQualityDashboardPDFReporter:
                 html_parts.append('<div class="section">')
                 html_parts.append('<h2>🗺️ Geographic Distribution</h2>')
                 
-                # Debug output the columns
-                logging.info(f"Available columns for geo detection in HTML report: {', '.join(self.analytics.data.columns)}")
-                
-                # Look for specific columns with geopoint data
-                potential_lat_cols = []
-                potential_lon_cols = []
-                
-                for col in self.analytics.data.columns:
-                    col_lower = col.lower()
-                    if any(term in col_lower for term in ['latitude', 'lat', '_lat']):
-                        potential_lat_cols.append(col)
-                        logging.info(f"Potential latitude column detected for HTML report: {col}")
-                    if any(term in col_lower for term in ['longitude', 'long', 'lon', 'lng', '_lon']):
-                        potential_lon_cols.append(col)
-                        logging.info(f"Potential longitude column detected for HTML report: {col}")
+                # Look for specific columns with geopoint data (shared with the PDF path)
+                potential_lat_cols, potential_lon_cols, _ = self._geo_columns(self.analytics.data)
                 
                 # First try automatic detection
                 map_html = map_handler.create_map_from_geopoints(self.analytics.data)
@@ -1250,9 +1532,7 @@ class FixedHighQualityDashboardPDFReporter:
             return True
             
         except Exception as e:
-            logging.error(f"Failed to generate HTML report: {e}")
-            import traceback
-            logging.error(f"Full error: {traceback.format_exc()}")
+            logging.error(f"Failed to generate HTML report: {e}", exc_info=True)
             return False
     
     def _create_fixed_header_image(self) -> List:
@@ -1348,7 +1628,7 @@ class FixedHighQualityDashboardPDFReporter:
                 story.append(Spacer(1, 10))
                 
                 # Create the chart
-                fig = plt.Figure(figsize=(8, 5), dpi=150)
+                fig = Figure(figsize=(8, 5), dpi=150)
                 ax = fig.add_subplot(111)
                 
                 # Generate chart based on type
@@ -1369,7 +1649,6 @@ class FixedHighQualityDashboardPDFReporter:
                 img_buffer = io.BytesIO()
                 fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
                 img_buffer.seek(0)
-                plt.close(fig)
                 
                 # Add chart to report
                 chart_img = Image(img_buffer, width=7*inch, height=4*inch)
@@ -1453,7 +1732,7 @@ class FixedHighQualityDashboardPDFReporter:
                 story.append(Paragraph(f"Form: {form_name} (ID: {form_id})", self.styles['MetricHeader']))
             
             # Use the updated current date and time
-            story.append(Paragraph(f"Created on {CURRENT_DATETIME} UTC", self.styles['Normal']))
+            story.append(Paragraph(f"Created on {current_datetime_str()} UTC", self.styles['Normal']))
             story.append(Paragraph(f"Created by: {CURRENT_USER}", self.styles['Normal']))
             story.append(Spacer(1, 30))
             
@@ -1578,15 +1857,21 @@ class FixedHighQualityDashboardPDFReporter:
             # Create table data
             table_data = [['Date', 'Day of Week', 'Submissions', 'Running Total']]
             
-            running_total = daily_data['submissions'].sum() - recent_data['submissions'].sum()
+            # Running totals: everything before the recent slice, plus the slice's own cumulative sum
+            n_recent = len(recent_data)
+            offset = daily_data['submissions'].iloc[:-n_recent].sum() if n_recent else daily_data['submissions'].sum()
+            running_totals = recent_data['submissions'].cumsum().to_numpy() + offset
             
-            for _, row in recent_data.iterrows():
+            # Format the date columns once for the whole slice: numpy renders datetime64[D]
+            # as ISO YYYY-MM-DD natively, and weekday names come from a fixed lookup
+            date_strs = recent_data['date'].to_numpy().astype('datetime64[D]').astype('U10')
+            day_names = _WEEKDAY_NAMES[recent_data['date'].dt.weekday.to_numpy()]
+            
+            # Iterate plain numpy arrays; iterating the Series boxes each value through pandas
+            submission_counts = recent_data['submissions'].to_numpy()
+            
+            for date_str, day_of_week, submissions, running_total in zip(date_strs, day_names, submission_counts, running_totals):
                 try:
-                    date_str = row['date'].strftime('%Y-%m-%d')
-                    day_of_week = row['date'].strftime('%A')
-                    submissions = row['submissions']
-                    running_total += submissions
-                    
                     table_data.append([
                         date_str,
                         day_of_week,
@@ -1625,22 +1910,20 @@ class FixedHighQualityDashboardPDFReporter:
         
         return story
     
-    def _create_dashboard_charts(self) -> List:
-        """Create modern dashboard-style charts with matplotlib warnings."""
+    def _create_dashboard_charts(self, daily_chart: Optional['Image'], weekly_chart: Optional['Image']) -> List:
+        """Create modern dashboard-style charts section from pre-rendered chart images."""
         story = []
         
         try:
             story.append(Paragraph("📈 Visual Analysis", self.styles['SectionHeader']))
             
             # Daily submissions chart
-            daily_chart = self._create_modern_daily_chart()
             if daily_chart:
                 story.append(Paragraph("Daily Submissions Trend", self.styles['MetricHeader']))
                 story.append(daily_chart)
                 story.append(Spacer(1, 20))
             
             # Weekly pattern chart
-            weekly_chart = self._create_weekly_pattern_chart()
             if weekly_chart:
                 story.append(Paragraph("Weekly Submission Pattern", self.styles['MetricHeader']))
                 story.append(weekly_chart)
@@ -1657,7 +1940,7 @@ class FixedHighQualityDashboardPDFReporter:
         
         return story
     
-    def _create_modern_daily_chart(self) -> Optional[Image]:
+    def _create_modern_daily_chart(self) -> Optional['Image']:
         """Create modern daily submissions chart."""
         try:
             daily_data = self.analytics.get_daily_submissions()
@@ -1665,45 +1948,55 @@ class FixedHighQualityDashboardPDFReporter:
                 logging.warning("No daily data available for chart")
                 return None
             
-            # Create figure with high DPI
-            fig, ax = plt.subplots(figsize=(12, 6), dpi=150)
+            # More than a year of daily points is unreadable and slow to rasterize;
+            # aggregate to weekly totals instead
+            resampled = len(daily_data) > 365
+            if resampled:
+                daily_data = daily_data.set_index('date')[['submissions']].resample('W').sum().reset_index()
+            
+            # Create figure with high DPI (standalone Figure, no pyplot state, so it is thread-safe)
+            fig = Figure(figsize=(12, 6), dpi=150)
+            ax = fig.add_subplot(111)
             fig.patch.set_facecolor('white')
             ax.set_facecolor('white')
             
             dates = daily_data['date']
             submissions = daily_data['submissions']
             
-            # Convert dates to proper datetime format to avoid matplotlib warnings
-            dates_numeric = [date.toordinal() for date in dates]
-            
-            # Plot data with numeric dates
+            # Plot data against the datetime values directly
             ax.plot(dates, submissions, color='#2E86AB', linewidth=3, marker='o', markersize=6)
             ax.fill_between(dates, submissions, alpha=0.3, color='#2E86AB')
             
             # Styling
-            ax.set_title('Daily Submissions Over Time', fontsize=16, fontweight='bold', color='#2E86AB')
+            chart_title = 'Weekly Submissions Over Time' if resampled else 'Daily Submissions Over Time'
+            ax.set_title(chart_title, fontsize=16, fontweight='bold', color='#2E86AB')
             ax.set_xlabel('Date', fontsize=12)
             ax.set_ylabel('Number of Submissions', fontsize=12)
             
             # Format dates
             if len(dates) > 0:
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-                ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
-                plt.xticks(rotation=45)
+                if resampled:
+                    # Weekly points span several years; space ticks by calendar days covered
+                    span_days = (dates.iloc[-1] - dates.iloc[0]).days
+                    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d/%y'))
+                    ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, span_days//10)))
+                else:
+                    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
+                    ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
+                ax.tick_params(axis='x', labelrotation=45)
             
             # Grid and styling
             ax.grid(True, alpha=0.3)
             ax.spines['top'].set_visible(False)
             ax.spines['right'].set_visible(False)
             
-            plt.tight_layout()
+            fig.tight_layout()
             
             # Save to buffer with high quality
             img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight', 
+            fig.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight', 
                        facecolor='white', edgecolor='none')
             img_buffer.seek(0)
-            plt.close(fig)
             
             return Image(img_buffer, width=7*inch, height=3.5*inch)
             
@@ -1711,7 +2004,7 @@ class FixedHighQualityDashboardPDFReporter:
             logging.error(f"Error creating daily chart: {e}")
             return None
     
-    def _create_weekly_pattern_chart(self) -> Optional[Image]:
+    def _create_weekly_pattern_chart(self) -> Optional['Image']:
         """Create weekly pattern bar chart with string handling."""
         try:
             weekly_data = self.analytics.get_weekly_trend()
@@ -1724,8 +2017,9 @@ class FixedHighQualityDashboardPDFReporter:
                 logging.warning("No weekly submission data to chart")
                 return None
             
-            # Create figure with high DPI
-            fig, ax = plt.subplots(figsize=(10, 6), dpi=150)
+            # Create figure with high DPI (standalone Figure, no pyplot state, so it is thread-safe)
+            fig = Figure(figsize=(10, 6), dpi=150)
+            ax = fig.add_subplot(111)
             fig.patch.set_facecolor('white')
             ax.set_facecolor('white')
             
@@ -1758,15 +2052,14 @@ class FixedHighQualityDashboardPDFReporter:
             ax.spines['top'].set_visible(False)
             ax.spines['right'].set_visible(False)
             
-            plt.xticks(rotation=45)
-            plt.tight_layout()
+            ax.tick_params(axis='x', labelrotation=45)
+            fig.tight_layout()
             
             # Save to buffer with high quality
             img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight', 
+            fig.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight', 
                        facecolor='white', edgecolor='none')
             img_buffer.seek(0)
-            plt.close(fig)
             
             return Image(img_buffer, width=6*inch, height=3.6*inch)
             
@@ -1774,21 +2067,98 @@ class FixedHighQualityDashboardPDFReporter:
             logging.error(f"Error creating weekly chart: {e}")
             return None
     
+    def _get_map_cache_path(self, data, geo_cols) -> Optional[Path]:
+        """Return the cache file for this dataset's map raster, keyed by coordinate data and map style.
+        
+        Only the columns the map can be drawn from are hashed: the detected candidates plus any
+        column MapHandler's own detection could pick. Without candidates there is nothing to key on.
+        """
+        if not any(geo_cols):
+            return None
+        key_cols = set().union(*geo_cols)
+        key_cols.update(col for col in data.columns
+                        if _MAP_LAT_COLUMN_RE.search(col) or _MAP_LON_COLUMN_RE.search(col)
+                        or _ODK_GEOPOINT_COLUMN_RE.search(col))
+        key_cols = [col for col in data.columns if col in key_cols]
+        try:
+            row_hashes = pd.util.hash_pandas_object(data[key_cols], index=False).to_numpy()
+        except Exception as e:
+            logging.debug(f"Could not fingerprint data for map cache: {e}")
+            return None
+        
+        key = hashlib.blake2b(
+            np.ascontiguousarray(row_hashes).tobytes()
+            + repr(key_cols).encode()
+            + repr(self.MAP_CACHE_STYLE).encode(),
+            digest_size=16
+        ).hexdigest()
+        return self.MAP_CACHE_DIR / f"{key}.jpg"
+    
+    def _prune_map_cache(self):
+        """Delete the least recently used map rasters beyond MAP_CACHE_MAX_FILES."""
+        try:
+            entries = sorted(self.MAP_CACHE_DIR.glob('*.jpg'), key=lambda p: p.stat().st_mtime, reverse=True)
+        except OSError as e:
+            logging.debug(f"Could not list map cache: {e}")
+            return
+        for stale in entries[self.MAP_CACHE_MAX_FILES:]:
+            try:
+                stale.unlink()
+            except OSError:
+                pass
+    
+    def _geo_columns(self, data) -> tuple:
+        """Return the geo column candidates for data, detected once and kept in data.attrs.
+        
+        The result is shared with any other reporter built on the same frame (e.g. the HTML
+        companion of a PDF export). If the caller already recorded attrs['geo_col'] as None,
+        no column can match and the scan is skipped.
+        """
+        geo_cols = data.attrs.get('geo_cols')
+        if geo_cols is None:
+            if 'geo_col' in data.attrs and data.attrs['geo_col'] is None:
+                geo_cols = ([], [], [])
+            else:
+                geo_cols = self._detect_geo_columns(data)
+            data.attrs['geo_cols'] = geo_cols
+        return geo_cols
+    
+    def _detect_geo_columns(self, data) -> tuple:
+        """Return (lat_cols, lon_cols, geopoint_cols) candidate column lists for the map section."""
+        potential_lat_cols = []
+        potential_lon_cols = []
+        
+        for col in data.columns:
+            if _LAT_COLUMN_RE.search(col):
+                potential_lat_cols.append(col)
+                logging.info(f"Potential latitude column detected: {col}")
+            if _LON_COLUMN_RE.search(col):
+                potential_lon_cols.append(col)
+                logging.info(f"Potential longitude column detected: {col}")
+        
+        # Look for ODK geopoint columns (format: "lat lon alt acc")
+        geopoint_cols = []
+        for col in data.columns:
+            if 'geopoint' in col.lower():
+                geopoint_cols.append(col)
+                logging.info(f"Potential ODK geopoint column detected: {col}")
+                # Sample the data to verify format
+                sample = data[col].dropna().iloc[0] if not data[col].dropna().empty else None
+                if sample:
+                    logging.info(f"Sample geopoint data: {sample}")
+        
+        return potential_lat_cols, potential_lon_cols, geopoint_cols
+    
     def _create_map_visualization(self) -> List:
         """Create map visualization from geopoint data with enhanced error handling."""
         story = []
+        paras = self._static_paras
         
         try:
             # Check if folium is available
             if not HAS_FOLIUM:
                 logging.warning("Folium library not available. Maps cannot be generated.")
-                story.append(Paragraph("🗺️ Geographic Distribution", self.styles['SectionHeader']))
-                story.append(Spacer(1, 10))
-                story.append(Paragraph(
-                    "Geographic visualization requires the folium library. "
-                    "Please install it with: pip install folium",
-                    self.styles['Normal']
-                ))
+                story.extend((paras['map_header'], Spacer(1, 10), paras['no_folium']))
                 return story
                 
             # Check if we have data
@@ -1804,490 +2174,263 @@ class FixedHighQualityDashboardPDFReporter:
             map_handler = MapHandler(debug=True)
             
             # Debug: Check for potential geo columns by printing numeric columns and their ranges
-            for col in data.columns:
+            if logging.getLogger().isEnabledFor(logging.INFO):
                 try:
-                    if data[col].dtype.kind in 'if':  # integer or float
-                        values = data[col].dropna()
-                        if not values.empty:
-                            min_val, max_val = values.min(), values.max()
+                    numeric_stats = data.select_dtypes(include='number').agg(['min', 'max', 'count'])
+                    for col, (min_val, max_val, count) in numeric_stats.items():
+                        if count:
                             logging.info(f"Numeric column: {col}, Range: {min_val} to {max_val}")
                 except Exception as e:
-                    logging.debug(f"Could not analyze column {col}: {e}")
+                    logging.debug(f"Could not analyze numeric columns: {e}")
                     
-            # Try to explicitly identify potential latitude and longitude columns
-            potential_lat_cols = []
-            potential_lon_cols = []
-            
-            for col in data.columns:
-                col_lower = col.lower()
-                if any(term in col_lower for term in ['latitude', 'lat', '_lat']):
-                    potential_lat_cols.append(col)
-                    logging.info(f"Potential latitude column detected: {col}")
-                if any(term in col_lower for term in ['longitude', 'long', 'lon', 'lng', '_lon']):
-                    potential_lon_cols.append(col)
-                    logging.info(f"Potential longitude column detected: {col}")
-            
-            # Look for ODK geopoint columns (format: "lat lon alt acc")
-            geopoint_cols = []
-            for col in data.columns:
-                if 'geopoint' in col.lower():
-                    geopoint_cols.append(col)
-                    logging.info(f"Potential ODK geopoint column detected: {col}")
-                    # Sample the data to verify format
-                    sample = data[col].dropna().iloc[0] if not data[col].dropna().empty else None
-                    if sample:
-                        logging.info(f"Sample geopoint data: {sample}")
-            
-            # First attempt - use automatic detection
-            map_html = map_handler.create_map_from_geopoints(data)
-            
-            # If automatic detection fails, try manual approaches with explicit columns
-            if not map_html and potential_lat_cols and potential_lon_cols:
-                logging.info(f"Attempting manual lat/lon mapping with: {potential_lat_cols[0]} and {potential_lon_cols[0]}")
-                map_html = map_handler.create_map_from_geopoints(
-                    data, 
-                    lat_column=potential_lat_cols[0], 
-                    lon_column=potential_lon_cols[0]
-                )
+            # Identify potential latitude/longitude and ODK geopoint columns (computed once per report)
+            potential_lat_cols, potential_lon_cols, geopoint_cols = self._geo_columns(data)
             
-            # If that fails and we have geopoint columns, try parsing them
-            if not map_html and geopoint_cols:
-                # Create temporary parsed columns
+            # Reuse the map raster from an earlier export of the same dataset if available
+            map_cache_path = self._get_map_cache_path(data, (potential_lat_cols, potential_lon_cols, geopoint_cols))
+            cached_map = None
+            if map_cache_path is not None and map_cache_path.exists():
                 try:
-                    logging.info(f"Attempting to parse geopoint column: {geopoint_cols[0]}")
-                    gp_col = geopoint_cols[0]
-                    
-                    # Make a copy to avoid modifying original
-                    temp_data = data.copy()
-                    
-                    # Try to extract lat/lon from space-separated geopoint string
-                    temp_data['_temp_lat'] = temp_data[gp_col].astype(str).str.split().str[0]
-                    temp_data['_temp_lon'] = temp_data[gp_col].astype(str).str.split().str[1]
-                    
-                    # Convert to float
-                    temp_data['_temp_lat'] = pd.to_numeric(temp_data['_temp_lat'], errors='coerce')
-                    temp_data['_temp_lon'] = pd.to_numeric(temp_data['_temp_lon'], errors='coerce')
-                    
-                    logging.info(f"Created temp columns with {temp_data['_temp_lat'].notna().sum()} valid coordinates")
-                    
-                    # Try with the temporary columns
+                    cached_map = io.BytesIO(map_cache_path.read_bytes())
+                    # Mark as recently used so pruning keeps it
+                    map_cache_path.touch()
+                    logging.info(f"Using cached map image: {map_cache_path.name}")
+                except OSError as e:
+                    logging.warning(f"Could not read cached map image: {e}")
+            
+            map_html = None
+            if cached_map is None:
+                # First attempt - use automatic detection
+                map_html = map_handler.create_map_from_geopoints(data)
+                
+                # If automatic detection fails, try manual approaches with explicit columns
+                if not map_html and potential_lat_cols and potential_lon_cols:
+                    logging.info(f"Attempting manual lat/lon mapping with: {potential_lat_cols[0]} and {potential_lon_cols[0]}")
                     map_html = map_handler.create_map_from_geopoints(
-                        temp_data, 
-                        lat_column='_temp_lat', 
-                        lon_column='_temp_lon'
+                        data, 
+                        lat_column=potential_lat_cols[0], 
+                        lon_column=potential_lon_cols[0]
                     )
-                except Exception as parse_err:
-                    logging.error(f"Error parsing geopoint column: {parse_err}")
-            
-            # If we have map HTML, create the visualization
-            if map_html:
-                # Add map section header
-                story.append(Paragraph("🗺️ Geographic Distribution", self.styles['SectionHeader']))
-                story.append(Spacer(1, 10))
-                
-                # Add map description
-                story.append(Paragraph(
-                    "The map below shows the geographical distribution of data collection points. "
-                    "Each marker represents a data collection location.",
-                    self.styles['Normal']
-                ))
-                story.append(Spacer(1, 15))
                 
-                # Convert map to image and add to report
-                map_image_path = map_handler.convert_map_to_image(map_html)
-                
-                if map_image_path and os.path.exists(map_image_path):
-                    # Get dimensions in inches (for PDF)
-                    width_inches, height_inches = HighQualityImageProcessor.get_image_dimensions_inches(
-                        map_image_path, target_dpi=150
-                    )
-                    
-                    # Ensure reasonable size for the map
-                    max_width_inches = 6.5  # For A4/Letter page with margins
-                    if width_inches > max_width_inches:
-                        ratio = max_width_inches / width_inches
-                        width_inches = max_width_inches
-                        height_inches = height_inches * ratio
+                # If that fails and we have geopoint columns, try parsing them
+                if not map_html and geopoint_cols:
+                    # Create temporary parsed columns
+                    try:
+                        logging.info(f"Attempting to parse geopoint column: {geopoint_cols[0]}")
+                        gp_col = geopoint_cols[0]
+                        
+                        # Make a copy to avoid modifying original
+                        temp_data = data.copy()
+                        
+                        # Try to extract lat/lon from space-separated geopoint string
+                        temp_data['_temp_lat'] = temp_data[gp_col].astype(str).str.split().str[0]
+                        temp_data['_temp_lon'] = temp_data[gp_col].astype(str).str.split().str[1]
+                        
+                        # Convert to float
+                        temp_data['_temp_lat'] = pd.to_numeric(temp_data['_temp_lat'], errors='coerce')
+                        temp_data['_temp_lon'] = pd.to_numeric(temp_data['_temp_lon'], errors='coerce')
+                        
+                        logging.info(f"Created temp columns with {temp_data['_temp_lat'].notna().sum()} valid coordinates")
+                        
+                        # Try with the temporary columns
+                        map_html = map_handler.create_map_from_geopoints(
+                            temp_data, 
+                            lat_column='_temp_lat', 
+                            lon_column='_temp_lon'
+                        )
+                    except Exception as parse_err:
+                        logging.error(f"Error parsing geopoint column: {parse_err}")
+            
+            # If we have a map, create the visualization
+            if cached_map is not None or map_html:
+                map_img = None
+                if cached_map is not None:
+                    # Cached JPEGs are already sized for the page at 150 DPI
+                    with PILImage.open(cached_map) as cached_img:
+                        width_px, height_px = cached_img.size
+                    cached_map.seek(0)
+                    map_img = Image(cached_map, width=width_px / 150 * inch, height=height_px / 150 * inch)
+                else:
+                    # Convert map to image and add to report
+                    map_image_path = map_handler.convert_map_to_image(map_html)
                     
-                    # Add the map image
-                    map_img = Image(map_image_path, width=width_inches*inch, height=height_inches*inch)
+                    if map_image_path and os.path.exists(map_image_path):
+                        # Get dimensions in inches (for PDF); the map PNG is written at 150 DPI,
+                        # so the IHDR pixel size is enough and Pillow need not open it
+                        png_size = HighQualityImageProcessor.get_png_size(map_image_path)
+                        if png_size:
+                            width_inches, height_inches = png_size[0] / 150, png_size[1] / 150
+                        else:
+                            width_inches, height_inches = HighQualityImageProcessor.get_image_dimensions_inches(
+                                map_image_path, target_dpi=150
+                            )
+                        
+                        # Ensure reasonable size for the map
+                        max_width_inches = 6.5  # For A4/Letter page with margins
+                        if width_inches > max_width_inches:
+                            ratio = max_width_inches / width_inches
+                            width_inches = max_width_inches
+                            height_inches = height_inches * ratio
+                        
+                        # Add the map image as an in-memory JPEG pre-sized for the page (150 DPI)
+                        map_buffer = HighQualityImageProcessor.encode_jpeg_for_pdf(
+                            map_image_path, width_inches, height_inches, dpi=150
+                        )
+                        if map_buffer:
+                            if map_cache_path is not None:
+                                try:
+                                    map_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                                    map_cache_path.write_bytes(map_buffer.getvalue())
+                                    self._prune_map_cache()
+                                except OSError as e:
+                                    logging.warning(f"Could not cache map image: {e}")
+                            map_img = Image(map_buffer, width=width_inches*inch, height=height_inches*inch)
+                            # The raster now lives in memory; the PNG on disk is no longer needed
+                            try:
+                                os.remove(map_image_path)
+                            except OSError:
+                                pass
+                        else:
+                            map_img = Image(map_image_path, width=width_inches*inch, height=height_inches*inch)
+                
+                if map_img is not None:
                     map_img.hAlign = 'CENTER'
-                    story.append(map_img)
-                    story.append(Spacer(1, 15))
-                    
-                    # Add note about interactive map in HTML version
-                    story.append(Paragraph(
-                        "Note: An interactive version of this map is available in the HTML report.",
-                        self.styles['Italic']
-                    ))
+                    # Section header, description, map and a note about the interactive HTML version
+                    story.extend((paras['map_header'], Spacer(1, 10),
+                                  paras['map_description'], Spacer(1, 15),
+                                  map_img, Spacer(1, 15),
+                                  paras['map_note'], Spacer(1, 20)))
                 else:
-                    story.append(Paragraph(
-                        "Geographic visualization is available in the HTML report version.",
-                        self.styles['Normal']
-                    ))
+                    story.extend((paras['map_header'], Spacer(1, 10),
+                                  paras['map_description'], Spacer(1, 15),
+                                  paras['html_only'], Spacer(1, 20)))
             else:
                 # No map could be generated - provide more helpful error info
-                story.append(Paragraph("🗺️ Geographic Distribution", self.styles['SectionHeader']))
-                story.append(Spacer(1, 10))
-                
                 if geopoint_cols or potential_lat_cols:
-                    detected_cols = []
-                    if geopoint_cols:
-                        detected_cols.append(f"Geopoint column(s): {', '.join(geopoint_cols)}")
-                    if potential_lat_cols:
-                        detected_cols.append(f"Lat column(s): {', '.join(potential_lat_cols)}")
-                    if potential_lon_cols:
-                        detected_cols.append(f"Lon column(s): {', '.join(potential_lon_cols)}")
+                    detected_cols = [
+                        f"{label}: {', '.join(cols)}"
+                        for label, cols in (("Geopoint column(s)", geopoint_cols),
+                                            ("Lat column(s)", potential_lat_cols),
+                                            ("Lon column(s)", potential_lon_cols))
+                        if cols
+                    ]
                     
                     explanation = (
-                        f"Potential geographic data was detected ({', '.join(detected_cols)}), "
+                        f"Potential geographic data was detected ({'; '.join(detected_cols)}), "
                         "but could not be processed. This may be due to invalid coordinates or formatting issues. "
                         "Try the HTML report for interactive maps."
                     )
-                    story.append(Paragraph(explanation, self.styles['Normal']))
+                    message = Paragraph(explanation, self.styles['Normal'])
                 else:
-                    story.append(Paragraph(
-                        "No geographic data was detected in this dataset. "
-                        "Geographic visualization requires latitude and longitude coordinates.",
-                        self.styles['Normal']
-                    ))
-            
-            story.append(Spacer(1, 20))
+                    message = paras['no_geo']
+                story.extend((paras['map_header'], Spacer(1, 10), message, Spacer(1, 20)))
                 
         except Exception as e:
-            logging.error(f"Error creating map visualization: {e}")
-            import traceback
-            logging.error(traceback.format_exc())
+            logging.error(f"Error creating map visualization: {e}", exc_info=True)
             
             # Add error message to the report
-            story.append(Paragraph("🗺️ Geographic Distribution", self.styles['SectionHeader']))
-            story.append(Spacer(1, 10))
-            story.append(Paragraph(
-                "Error creating geographic visualization. This may be due to invalid coordinates or data format issues.",
-                self.styles['Normal']
-            ))
-            story.append(Spacer(1, 20))
+            story.extend((paras['map_header'], Spacer(1, 10), paras['map_error'], Spacer(1, 20)))
         
         return story
+
+# ============================================================================
+# Enhanced GUI Application with Image Support
+# ============================================================================
+
+_gui_logger = logging.getLogger("odk_dashboard.gui")
+
+
+def _write_settings_file(path, settings: Dict[str, Any]) -> None:
+    """Write a settings dict as indented JSON, using orjson when it is installed.
     
-def _create_modern_daily_chart(self) -> Optional[Image]:
-    """Create modern daily submissions chart."""
-    try:
-        daily_data = self.analytics.get_daily_submissions()
-        if daily_data.empty:
-            logging.warning("No daily data available for chart")
-            return None
-        
-        # Create figure with high DPI
-        fig, ax = plt.subplots(figsize=(12, 6), dpi=150)
-        fig.patch.set_facecolor('white')
-        ax.set_facecolor('white')
-        
-        dates = daily_data['date']
-        submissions = daily_data['submissions']
-        
-        # Convert dates to proper datetime format to avoid matplotlib warnings
-        dates_numeric = [date.toordinal() for date in dates]
-        
-        # Plot data with numeric dates
-        ax.plot(dates, submissions, color='#2E86AB', linewidth=3, marker='o', markersize=6)
-        ax.fill_between(dates, submissions, alpha=0.3, color='#2E86AB')
-        
-        # Styling
-        ax.set_title('Daily Submissions Over Time', fontsize=16, fontweight='bold', color='#2E86AB')
-        ax.set_xlabel('Date', fontsize=12)
-        ax.set_ylabel('Number of Submissions', fontsize=12)
-        
-        # Format dates
-        if len(dates) > 0:
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-            ax.xaxis.set_major_locator(mdates.DayLocator(interval=max(1, len(dates)//10)))
-            plt.xticks(rotation=45)
-        
-        # Grid and styling
-        ax.grid(True, alpha=0.3)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        plt.tight_layout()
-        
-        # Save to buffer with high quality
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        img_buffer.seek(0)
-        plt.close(fig)
-        
-        return Image(img_buffer, width=7*inch, height=3.5*inch)
-        
-    except Exception as e:
-        logging.error(f"Error creating daily chart: {e}")
-        return None
+    The file is written next to its destination and moved into place, so an interrupted save
+    never leaves a truncated settings file behind.
+    """
+    path = Path(path)
+    if HAS_ORJSON:
+        payload = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(settings, indent=2).encode('utf-8')
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+
+
+def _read_settings_file(path) -> Dict[str, Any]:
+    """Read a settings JSON file written by _write_settings_file (or by older versions)."""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
 
-def _create_weekly_pattern_chart(self) -> Optional[Image]:
-    """Create weekly pattern bar chart with string handling."""
-    try:
-        weekly_data = self.analytics.get_weekly_trend()
-        if not weekly_data or 'weekday_counts' not in weekly_data:
-            logging.warning("No weekly data available for chart")
-            return None
-        
-        weekday_counts = weekly_data['weekday_counts']
-        if weekday_counts.empty or weekday_counts.sum() == 0:
-            logging.warning("No weekly submission data to chart")
-            return None
-        
-        # Create figure with high DPI
-        fig, ax = plt.subplots(figsize=(10, 6), dpi=150)
-        fig.patch.set_facecolor('white')
-        ax.set_facecolor('white')
-        
-        # Convert weekday names to positions to avoid matplotlib categorical warnings
-        weekdays = list(weekday_counts.index)
-        values = list(weekday_counts.values)
-        positions = range(len(weekdays))
-        
-        # Create bar chart with numeric positions
-        colors_list = ['#2E86AB', '#A23B72', '#F18F01', '#C73E1D', '#4CAF50', '#FF9800', '#9C27B0']
-        bars = ax.bar(positions, values, 
-                     color=colors_list[:len(values)], alpha=0.8)
-        
-        # Set weekday labels
-        ax.set_xticks(positions)
-        ax.set_xticklabels(weekdays)
-        
-        # Add value labels on bars
-        for i, (bar, value) in enumerate(zip(bars, values)):
-            if value > 0:
-                ax.text(i, value + 0.1, f'{int(value)}', 
-                       ha='center', va='bottom', fontweight='bold')
-        
-        # Styling
-        ax.set_title('Submissions by Day of Week', fontsize=16, fontweight='bold', color='#2E86AB')
-        ax.set_xlabel('Day of Week', fontsize=12)
-        ax.set_ylabel('Number of Submissions', fontsize=12)
-        
-        # Remove top and right spines
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        
-        # Save to buffer with high quality
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=300, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        img_buffer.seek(0)
-        plt.close(fig)
-        
-        return Image(img_buffer, width=6*inch, height=3.6*inch)
-        
-    except Exception as e:
-        logging.error(f"Error creating weekly chart: {e}")
-        return None
 
-def _create_map_visualization(self) -> List:
-    """Create map visualization from geopoint data with enhanced error handling."""
-    story = []
+class _DaemonThreadPool(Executor):
+    """Fixed-size thread pool whose workers are daemon threads.
     
-    try:
-        # Check if folium is available
-        if not HAS_FOLIUM:
-            logging.warning("Folium library not available. Maps cannot be generated.")
-            story.append(Paragraph("🗺️ Geographic Distribution", self.styles['SectionHeader']))
-            story.append(Spacer(1, 10))
-            story.append(Paragraph(
-                "Geographic visualization requires the folium library. "
-                "Please install it with: pip install folium",
-                self.styles['Normal']
-            ))
-            return story
-            
-        # Check if we have data
-        data = self.analytics.data
-        if data.empty:
-            logging.warning("No data available for map visualization.")
-            return story
-            
-        # Add debugging log output for column inspection
-        logging.info(f"Available columns for geo detection: {', '.join(data.columns)}")
-        
-        # Initialize map handler with explicit debug mode
-        map_handler = MapHandler(debug=True)
-        
-        # Debug: Check for potential geo columns by printing numeric columns and their ranges
-        for col in data.columns:
-            try:
-                if data[col].dtype.kind in 'if':  # integer or float
-                    values = data[col].dropna()
-                    if not values.empty:
-                        min_val, max_val = values.min(), values.max()
-                        logging.info(f"Numeric column: {col}, Range: {min_val} to {max_val}")
-            except Exception as e:
-                logging.debug(f"Could not analyze column {col}: {e}")
-                
-        # Try to explicitly identify potential latitude and longitude columns
-        potential_lat_cols = []
-        potential_lon_cols = []
-        
-        for col in data.columns:
-            col_lower = col.lower()
-            if any(term in col_lower for term in ['latitude', 'lat', '_lat']):
-                potential_lat_cols.append(col)
-                logging.info(f"Potential latitude column detected: {col}")
-            if any(term in col_lower for term in ['longitude', 'long', 'lon', 'lng', '_lon']):
-                potential_lon_cols.append(col)
-                logging.info(f"Potential longitude column detected: {col}")
-        
-        # Look for ODK geopoint columns (format: "lat lon alt acc")
-        geopoint_cols = []
-        for col in data.columns:
-            if 'geopoint' in col.lower():
-                geopoint_cols.append(col)
-                logging.info(f"Potential ODK geopoint column detected: {col}")
-                # Sample the data to verify format
-                sample = data[col].dropna().iloc[0] if not data[col].dropna().empty else None
-                if sample:
-                    logging.info(f"Sample geopoint data: {sample}")
-        
-        # First attempt - use automatic detection
-        map_html = map_handler.create_map_from_geopoints(data)
-        
-        # If automatic detection fails, try manual approaches with explicit columns
-        if not map_html and (potential_lat_cols and potential_lon_cols):
-            logging.info(f"Attempting manual lat/lon mapping with: {potential_lat_cols[0]} and {potential_lon_cols[0]}")
-            map_html = map_handler.create_map_from_geopoints(
-                data, 
-                lat_column=potential_lat_cols[0], 
-                lon_column=potential_lon_cols[0]
-            )
-        
-        # If that fails and we have geopoint columns, try parsing them
-        if not map_html and geopoint_cols:
-            # Create temporary parsed columns
+    ThreadPoolExecutor joins its workers at interpreter exit, so closing the window during a
+    download or PDF build would keep the process alive with no UI until the job finished.
+    """
+    
+    def __init__(self, max_workers, thread_name_prefix):
+        self._work = queue.SimpleQueue()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"{thread_name_prefix}_{i}", daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+    
+    def _worker(self):
+        while True:
+            item = self._work.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
             try:
-                logging.info(f"Attempting to parse geopoint column: {geopoint_cols[0]}")
-                gp_col = geopoint_cols[0]
-                
-                # Make a copy to avoid modifying original
-                temp_data = data.copy()
-                
-                # Try to extract lat/lon from space-separated geopoint string
-                temp_data['_temp_lat'] = temp_data[gp_col].astype(str).str.split().str[0]
-                temp_data['_temp_lon'] = temp_data[gp_col].astype(str).str.split().str[1]
-                
-                # Convert to float
-                temp_data['_temp_lat'] = pd.to_numeric(temp_data['_temp_lat'], errors='coerce')
-                temp_data['_temp_lon'] = pd.to_numeric(temp_data['_temp_lon'], errors='coerce')
-                
-                logging.info(f"Created temp columns with {temp_data['_temp_lat'].notna().sum()} valid coordinates")
-                
-                # Try with the temporary columns
-                map_html = map_handler.create_map_from_geopoints(
-                    temp_data, 
-                    lat_column='_temp_lat', 
-                    lon_column='_temp_lon'
-                )
-            except Exception as parse_err:
-                logging.error(f"Error parsing geopoint column: {parse_err}")
-        
-        # If we have map HTML, create the visualization
-        if map_html:
-            # Add map section header
-            story.append(Paragraph("🗺️ Geographic Distribution", self.styles['SectionHeader']))
-            story.append(Spacer(1, 10))
-            
-            # Add map description
-            story.append(Paragraph(
-                "The map below shows the geographical distribution of data collection points. "
-                "Each marker represents a data collection location.",
-                self.styles['Normal']
-            ))
-            story.append(Spacer(1, 15))
-            
-            # Convert map to image and add to report
-            map_image_path = map_handler.convert_map_to_image(map_html)
-            
-            if map_image_path and os.path.exists(map_image_path):
-                # Get dimensions in inches (for PDF)
-                width_inches, height_inches = HighQualityImageProcessor.get_image_dimensions_inches(
-                    map_image_path, target_dpi=150
-                )
-                
-                # Ensure reasonable size for the map
-                max_width_inches = 6.5  # For A4/Letter page with margins
-                if width_inches > max_width_inches:
-                    ratio = max_width_inches / width_inches
-                    width_inches = max_width_inches
-                    height_inches = height_inches * ratio
-                
-                # Add the map image
-                map_img = Image(map_image_path, width=width_inches*inch, height=height_inches*inch)
-                map_img.hAlign = 'CENTER'
-                story.append(map_img)
-                story.append(Spacer(1, 15))
-                
-                # Add note about interactive map in HTML version
-                story.append(Paragraph(
-                    "Note: An interactive version of this map is available in the HTML report.",
-                    self.styles['Italic']
-                ))
-            else:
-                story.append(Paragraph(
-                    "Geographic visualization is available in the HTML report version.",
-                    self.styles['Normal']
-                ))
-        else:
-            # No map could be generated - provide more helpful error info
-            story.append(Paragraph("🗺️ Geographic Distribution", self.styles['SectionHeader']))
-            story.append(Spacer(1, 10))
-            
-            if geopoint_cols or potential_lat_cols:
-                detected_cols = []
-                if geopoint_cols:
-                    detected_cols.append(f"Geopoint column(s): {', '.join(geopoint_cols)}")
-                if potential_lat_cols:
-                    detected_cols.append(f"Lat column(s): {', '.join(potential_lat_cols)}")
-                if potential_lon_cols:
-                    detected_cols.append(f"Lon column(s): {', '.join(potential_lon_cols)}")
-                
-                explanation = (
-                    f"Potential geographic data was detected ({', '.join(detected_cols)}), "
-                    "but could not be processed. This may be due to invalid coordinates or formatting issues. "
-                    "Try the HTML report for interactive maps."
-                )
-                story.append(Paragraph(explanation, self.styles['Normal']))
-            else:
-                story.append(Paragraph(
-                    "No geographic data was detected in this dataset. "
-                    "Geographic visualization requires latitude and longitude coordinates.",
-                    self.styles['Normal']
-                ))
-        
-        story.append(Spacer(1, 20))
-            
-    except Exception as e:
-        logging.error(f"Error creating map visualization: {e}")
-        import traceback
-        logging.error(traceback.format_exc())
-        
-        # Add error message to the report
-        story.append(Paragraph("🗺️ Geographic Distribution", self.styles['SectionHeader']))
-        story.append(Spacer(1, 10))
-        story.append(Paragraph(
-            "Error creating geographic visualization. This may be due to invalid coordinates or data format issues.",
-            self.styles['Normal']
-        ))
-        story.append(Spacer(1, 20))
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
     
-    return story
+    def submit(self, fn, /, *args, **kwargs):
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        future = Future()
+        self._work.put((future, fn, args, kwargs))
+        return future
+    
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self._shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._work.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+        for _ in self._threads:
+            self._work.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
 
-# ============================================================================
-# Enhanced GUI Application with Image Support
-# ============================================================================
 
 class FixedODKDashboardGUI:
+    # Rolling scrollback limit for the output text area
+    LOG_MAX_LINES = 5000
+    # How often queued log lines are written to the output text area
+    LOG_FLUSH_INTERVAL_MS = 100
+    # Reuse an authenticated ODK Central client for this long before logging in again
+    CLIENT_TTL_SECONDS = 20 * 60
+    # How long a fetched forms list is reused by the report actions
+    FORMS_TTL_SECONDS = 60
+    # Number of header image previews kept as ready-made PhotoImages
+    IMAGE_PREVIEW_CACHE_SIZE = 16
+    # Quiet period before a header path edit rebuilds the preview / a field edit is auto-saved
+    IMAGE_PREVIEW_DEBOUNCE_MS = 200
+    SETTINGS_SAVE_DEBOUNCE_MS = 250
+
     def __init__(self, root):
         self.root = root
         self.root.title("Dashboard Reporter")
@@ -2307,13 +2450,93 @@ class FixedODKDashboardGUI:
         # Add an explicit StringVar bound to the variable selection combobox so we can display messages
         self.selected_variable = tk.StringVar(value="")  
 
+        # Chart preview widgets, built on the first preview and reused afterwards
+        self._preview_fig = None
+        self._preview_ax = None
+        self._preview_canvas = None
+        self._preview_toolbar = None
+        self._preview_key = None  # (data id, variable, chart type) currently drawn
+        self._preview_toolbar_frame = None
+        self.show_chart_toolbar = tk.BooleanVar(value=False)
+
+        # Chart preview handlers by dropdown name (see _CHART_TYPES)
+        self._chart_dispatch = {
+            "Horizontal Bar Chart": self._create_horizontal_bar_chart,
+            "Vertical Bar Chart": self._create_vertical_bar_chart,
+            "Pie Chart": self._create_pie_chart,
+            "Line Chart": self._create_line_chart,
+            "Area Chart": self._create_area_chart,
+            "Count Plot": self._create_count_plot,
+        }
+
+        # value_counts/np.histogram results for the chart helpers, keyed by (data generation, variable, ...).
+        # The generation goes up on every (re)load; id() of a freed frame can be reused by the next one
+        self._agg_cache = {}
+        self._data_generation = 0
+
+        # Log lines waiting to be written to output_text. Worker threads only append here;
+        # the Tk thread drains it on a timer (see _flush_log)
+        self._log_queue = deque()
+
+        # Header image previews keyed by (path, mtime_ns, size), least recently used first
+        self._img_preview_cache = OrderedDict()
+        
+        # Pending root.after ids for the debounced preview rebuild and settings auto-save
+        self._preview_after_id = None
+        self._settings_after_id = None
+
+        # Network and report work runs here so the Tk event loop stays responsive
+        self._pool = _DaemonThreadPool(max_workers=2, thread_name_prefix="odk-gui")
+        # Set by on_closing before the root is destroyed; tasks still running then skip all UI work
+        self._closing = False
+        self._active_tasks = 0
+        # Finished _pool futures, handed to the Tk thread by _flush_log
+        self._done_queue = queue.SimpleQueue()
+        # Side jobs a _pool task waits on (forms prefetch, HTML companion). Kept separate so a
+        # task never waits on work queued behind itself
+        self._aux_pool = _DaemonThreadPool(max_workers=2, thread_name_prefix="odk-gui-aux")
+
+        # Authenticated ODKCentralClient per (url, username, password, project), with login time
+        self._client_cache = {}
+        self._client_lock = threading.Lock()
+
+        # Forms list per (url, project id), with fetch time
+        self._forms_cache = {}
+
+        # base64 form of the password last saved, and a digest of the plaintext it came from
+        self._cached_b64 = ""
+        self._last_pw_hash = None
+
         # Style
         self.style = ttk.Style()
         self.style.theme_use('classic')
 
         self.setup_ui()
+        self.root.after(self.LOG_FLUSH_INTERVAL_MS, self._flush_log)
+        
+        # Load saved settings if available
+        self.load_saved_settings()
+        
+        # Any later edit to a persisted field marks the auto-saved settings as stale
+        self._settings_dirty = False
+        for var in (self.base_url, self.username, self.password, self.remember_password, self.project_id,
+                    self.form_id, self.report_title, self.header_image_path):
+            var.trace_add('write', self._mark_settings_dirty)
+        # Typing or pasting a path refreshes the preview once the edits pause
+        self.header_image_path.trace_add('write', lambda *_: self.update_image_preview())
         
     def setup_ui(self):
+        # Shared style for the action buttons, configured once for every button that uses it
+        self.style.configure('Accent.TButton',
+                             borderwidth=1,
+                             relief="flat",
+                             background="#4CAF50",
+                             foreground="white",
+                             font=("Helvetica", 10, "bold"))
+        self.style.map('Accent.TButton',
+                       background=[('active', "#A00606"),
+                                   ('pressed', "#150BC9")])
+        
         # Configure the root window to expand and fill the screen
         self.root.grid_rowconfigure(0, weight=1)
         self.root.grid_columnconfigure(0, weight=1)
@@ -2342,17 +2565,35 @@ class FixedODKDashboardGUI:
         # Create window inside canvas with scrollable_frame
         canvas_window = main_canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         
-        # Configure scrolling behavior
+        # Configure scrolling behavior. Resize drags fire <Configure> continuously, so both
+        # handlers are debounced: each event cancels the pending update and schedules a new one
+        self._frame_resize_after_id = None
+        self._canvas_resize_after_id = None
+        
         def configure_canvas(event):
+            if self._frame_resize_after_id is not None:
+                self.root.after_cancel(self._frame_resize_after_id)
+            self._frame_resize_after_id = self.root.after(50, apply_frame_resize, event.width)
+        
+        def apply_frame_resize(canvas_width):
+            self._frame_resize_after_id = None
             # Update the scrollregion to encompass the scrollable frame
             main_canvas.configure(scrollregion=main_canvas.bbox("all"))
             
             # Make the scrollable frame expand to fill canvas width
-            canvas_width = event.width
+            main_canvas.itemconfig(canvas_window, width=canvas_width)
+        
+        def configure_main_canvas(event):
+            if self._canvas_resize_after_id is not None:
+                self.root.after_cancel(self._canvas_resize_after_id)
+            self._canvas_resize_after_id = self.root.after(50, apply_canvas_resize, event.width)
+        
+        def apply_canvas_resize(canvas_width):
+            self._canvas_resize_after_id = None
             main_canvas.itemconfig(canvas_window, width=canvas_width)
         
         scrollable_frame.bind("<Configure>", configure_canvas)
-        main_canvas.bind("<Configure>", lambda e: main_canvas.itemconfig(canvas_window, width=e.width))
+        main_canvas.bind("<Configure>", configure_main_canvas)
         
         # Title
         title_frame = ttk.Frame(scrollable_frame)
@@ -2365,7 +2606,7 @@ class FixedODKDashboardGUI:
     
         # Version and date info
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        info_label = ttk.Label(title_frame, text=f"Version 2.2.1 | {CURRENT_DATETIME} UTC | User: {CURRENT_USER}", 
+        info_label = ttk.Label(title_frame, text=f"Version 2.2.1 | {current_datetime_str()} UTC | User: {CURRENT_USER}", 
                             font=("Helvetica", 8), foreground="darkblue")
         info_label.pack(pady=(5, 0))
                 
@@ -2401,13 +2642,6 @@ class FixedODKDashboardGUI:
         # Test connection button
         test_btn = ttk.Button(odk_frame, text="🔍 Test Connection", command=self.test_connection)
         test_btn.config(style='Accent.TButton')
-        self.style.configure('Accent.TButton',
-                            background="#1D15BE",
-                            foreground='white',
-                            font=('Helvetica', 10, 'bold'))
-        self.style.map('Accent.TButton',
-                    background=[('active', '#1F5F7A'),
-                                ('pressed', "#7F0909")])
 
         test_btn.grid(row=4, column=1, sticky=tk.W, pady=10, padx=(10, 0))        
         odk_frame.columnconfigure(1, weight=1)
@@ -2426,13 +2660,6 @@ class FixedODKDashboardGUI:
         # List forms button
         list_forms_btn = ttk.Button(form_frame, text="📄 List Available Forms", command=self.list_forms)
         list_forms_btn.config(style='Accent.TButton')
-        self.style.configure('Accent.TButton',
-                            background="#1D15BE",
-                            foreground='white',
-                            font=('Helvetica', 10, 'bold'))
-        self.style.map('Accent.TButton',
-                    background=[('active', '#1F5F7A'),
-                                ('pressed', '#0D4F73')])
         list_forms_btn.grid(row=1, column=1, sticky=tk.W, pady=5, padx=(10, 0))
         
         form_frame.columnconfigure(1, weight=1)
@@ -2447,13 +2674,6 @@ class FixedODKDashboardGUI:
         
         image_browse_btn = ttk.Button(image_frame, text="Browse...", command=self.browse_header_image)
         image_browse_btn.config(style='Accent.TButton')
-        self.style.configure('Accent.TButton',
-                            background="#1D15BE",
-                            foreground='white',
-                            font=('Helvetica', 10, 'bold'))
-        self.style.map('Accent.TButton',
-                    background=[('active', '#1F5F7A'),
-                                ('pressed', '#0D4F73')])
         image_browse_btn.grid(row=0, column=2, pady=5)
         
         # Image quality info
@@ -2466,19 +2686,19 @@ class FixedODKDashboardGUI:
         self.image_preview_frame = ttk.Frame(image_frame)
         self.image_preview_frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=10)
         
+        # Preview labels are created once and reconfigured on every image change
+        self._preview_img_label = ttk.Label(self.image_preview_frame, justify=tk.CENTER)
+        self._preview_img_label.pack(pady=5)
+        self._preview_info_label = ttk.Label(self.image_preview_frame, text="",
+                                             font=("Helvetica", 9), justify=tk.CENTER)
+        self._preview_info_label.pack(pady=5)
+        
         # Image controls
         controls_frame = ttk.Frame(image_frame)
         controls_frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
         
         clear_image_btn = ttk.Button(controls_frame, text="Clear Image", command=self.clear_header_image)
         clear_image_btn.config(style='Accent.TButton')
-        self.style.configure('Accent.TButton',
-                            background="#1D15BE",
-                            foreground='white',
-                            font=('Helvetica', 10, 'bold'))
-        self.style.map('Accent.TButton',
-                    background=[('active', '#1F5F7A'),
-                                ('pressed', '#0D4F73')])
         clear_image_btn.pack(side=tk.LEFT, padx=(0, 10))
         
         self.image_info_label = ttk.Label(controls_frame, text="", font=("Helvetica", 8))
@@ -2506,15 +2726,6 @@ class FixedODKDashboardGUI:
         generate_btn.pack(side=tk.LEFT, padx=(0, 10))
         generate_btn.config(style='Accent.TButton')
         
-        # Configure a colored style for the generate button
-        self.style.configure('Accent.TButton', 
-                background='#2E86AB',
-                foreground='white',
-                font=('Helvetica', 10, 'bold'))
-        self.style.map('Accent.TButton',
-                background=[('active', "#750505"),
-                    ('pressed', "#780D0D")])
-        
         # Generate HTML report button (new)
         html_btn = ttk.Button(action_frame, text="🌐 Generate HTML Report", 
                             command=self.generate_html_report)
@@ -2526,17 +2737,11 @@ class FixedODKDashboardGUI:
         save_btn.pack(side=tk.LEFT, padx=(0, 10))
         save_btn.config(style='Accent.TButton')
 
-        self.style.map('Accent.TButton',
-                background=[('active', "#890E0E"),
-                    ('pressed', "#800A0A")])
         # Load settings button
         load_btn = ttk.Button(action_frame, text="📁 Load Settings", command=self.load_settings)
         load_btn.pack(side=tk.LEFT)
         load_btn.config(style='Accent.TButton')
 
-        self.style.map('Accent.TButton',
-                background=[('active', "#A00606"),
-                    ('pressed', "#150BC9")])
         # Progress bar
         self.progress = ttk.Progressbar(scrollable_frame, mode='indeterminate')
         self.progress.pack(fill=tk.X, padx=20, pady=10)
@@ -2549,26 +2754,45 @@ class FixedODKDashboardGUI:
         text_frame = ttk.Frame(output_frame)
         text_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.output_text = tk.Text(text_frame, height=10, wrap=tk.WORD, font=("Consolas", 9))
+        self.output_text = tk.Text(text_frame, height=10, wrap=tk.WORD, font=("Consolas", 9),
+                                   undo=False, maxundo=0)
         text_scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.output_text.yview)
         self.output_text.configure(yscrollcommand=text_scrollbar.set)
         
         self.output_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         text_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Enhanced mousewheel scrolling for better user experience
+        # Enhanced mousewheel scrolling for better user experience. Trackpads fire wheel
+        # events far faster than the frame can repaint, so deltas are accumulated and
+        # applied at most once per 16 ms (~60 FPS)
+        self._wheel_accum = 0
+        self._wheel_pending = False
+        
         def _on_mousewheel(event):
-            # Scroll direction and speed calibration
-            scroll_speed = 1
             if event.delta:
                 # For Windows and MacOS
-                main_canvas.yview_scroll(int(-1 * (event.delta / 120) * scroll_speed), "units")
+                self._wheel_accum += event.delta
             elif event.num == 4:
                 # For Linux - scroll up
-                main_canvas.yview_scroll(-1 * scroll_speed, "units")
+                self._wheel_accum += 120
             elif event.num == 5:
                 # For Linux - scroll down
-                main_canvas.yview_scroll(scroll_speed, "units")
+                self._wheel_accum -= 120
+            else:
+                return
+            
+            if not self._wheel_pending:
+                self._wheel_pending = True
+                self.root.after(16, _flush_wheel)
+        
+        def _flush_wheel():
+            # Scroll direction and speed calibration
+            scroll_speed = 1
+            units = int(-1 * (self._wheel_accum / 120) * scroll_speed)
+            self._wheel_accum = 0
+            self._wheel_pending = False
+            if units:
+                main_canvas.yview_scroll(units, "units")
                 
         # Bind mousewheel for Windows and MacOS
         main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
@@ -2593,9 +2817,7 @@ class FixedODKDashboardGUI:
         
         # Chart Type Selection Dropdown
         ttk.Label(var_select_frame, text="Chart Type:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.chart_type = ttk.Combobox(var_select_frame, state="readonly", width=30, 
-                                    values=["Horizontal Bar Chart", "Vertical Bar Chart", "Pie Chart", 
-                                            "Line Chart", "Area Chart", "Count Plot"])
+        self.chart_type = ttk.Combobox(var_select_frame, state="readonly", width=30, values=_CHART_TYPES)
         self.chart_type.grid(row=1, column=1, sticky=(tk.W, tk.E), pady=5, padx=(10, 0))        
 ##########################################################################################
         # Message label shown to the right of the combobox
@@ -2606,12 +2828,6 @@ class FixedODKDashboardGUI:
         reload_btn = ttk.Button(var_select_frame, text="Reload Data", command=self.reload_data)
         reload_btn.grid(row=0, column=3, padx=(10,0))
         reload_btn.config(style='Accent.TButton')
-        self.style.configure('Accent.TButton',
-                              borderwidth=1,
-                              relief="flat",
-                              background="#4CAF50",
-                              foreground="white",
-                              font=("Helvetica", 10, "bold"))
 
 # Ensure chart_type remains as-is; set default after creating it:
         self.chart_type.current(0)  # Default to Horizontal Bar Chart
@@ -2624,6 +2840,12 @@ class FixedODKDashboardGUI:
                                 command=self.add_chart_to_report)
         add_chart_btn.grid(row=2, column=0, columnspan=2, pady=10)
         
+        # The matplotlib navigation toolbar is only built when asked for
+        toolbar_checkbox = ttk.Checkbutton(var_select_frame, text="Show chart toolbar",
+                                           variable=self.show_chart_toolbar,
+                                           command=self._toggle_chart_toolbar)
+        toolbar_checkbox.grid(row=2, column=2, sticky=tk.W, padx=(10, 0))
+        
         # Preview Frame for Chart
         self.chart_preview_frame = ttk.Frame(visual_frame)
         self.chart_preview_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -2638,19 +2860,21 @@ class FixedODKDashboardGUI:
         reload_btn = ttk.Button(var_select_frame, text="Reload Data", command=self.populate_variable_dropdown)
         reload_btn.grid(row=0, column=3, padx=(10,0))
         reload_btn.config(style='Accent.TButton')
-        self.style.configure('Accent.TButton',
-                              borderwidth=1,
-                              relief="flat",
-                              background="#4CAF50",
-                              foreground="white",
-                              font=("Helvetica", 10, "bold"))
 
-    def populate_variable_dropdown(self):
+    def populate_variable_dropdown(self, data=None):
         """
-        Populate the variable combobox with columns from self.analytics.data.
+        Populate the variable combobox with columns from data (default: self.analytics.data).
         When no data is present, disable the combobox and show a clear message.
+        Must run on the Tk thread; after a download _report_done calls it.
         """
+        if data is None:
+            data = getattr(getattr(self, 'analytics', None), 'data', None)
         try:
+            # Data was (re)loaded, so cached chart aggregates are stale
+            self._data_generation += 1
+            self._agg_cache.clear()
+            self._preview_key = None
+
             # Clear any previous displayed text and values
             try:
                 self.variable_selection.set('')  # clear displayed text
@@ -2658,13 +2882,12 @@ class FixedODKDashboardGUI:
                 pass
             self.variable_selection['values'] = []
 
-            # Check analytics object and DataFrame presence
-            if hasattr(self, 'analytics') and getattr(self.analytics, 'data', None) is not None and not self.analytics.data.empty:
+            # Check DataFrame presence
+            if data is not None and not data.empty:
                 # Filter out internal columns and common meta columns
                 columns = [
-                    col for col in self.analytics.data.columns
-                    if not col.startswith('_') and col.lower() not in
-                    ['submissiondate', 'instanceid', 'deviceid', 'submission_date']
+                    col for col in data.columns
+                    if not col.startswith('_') and col.lower() not in _EXCLUDED_VARIABLE_COLUMNS
                 ]
 
                 if columns:
@@ -2741,37 +2964,37 @@ class FixedODKDashboardGUI:
             self.log_output(f"❌ Error adding chart: {str(e)}", "ERROR")
 
     def create_chart_preview(self, variable, chart_type):
-        """Create a preview of the chart."""
+        """Create a preview of the chart.
+        
+        The figure, Tk canvas and toolbar are built on the first call and reused; later
+        previews only clear the axes and re-plot.
+        """
         try:
-            # Clear previous chart
-            for widget in self.chart_preview_frame.winfo_children():
-                widget.destroy()
-            
             # Get data for the variable
             data = self.analytics.data
             
             # Check if variable exists in data
             if variable not in data.columns:
+                self._reset_chart_preview()
                 ttk.Label(self.chart_preview_frame, text=f"Error: Variable '{variable}' not found in data").pack(pady=20)
                 return
             
-            # Create figure
-            fig = plt.Figure(figsize=(8, 4), dpi=100)
-            ax = fig.add_subplot(111)
+            # The canvas already shows exactly this chart; nothing to redraw
+            preview_key = (self._data_generation, variable, chart_type)
+            if self._preview_canvas is not None and preview_key == self._preview_key:
+                return
+            
+            if self._preview_canvas is None:
+                self._build_chart_preview()
+            
+            fig = self._preview_fig
+            ax = self._preview_ax
+            ax.clear()
             
             # Different chart types
-            if chart_type == "Horizontal Bar Chart":
-                self._create_horizontal_bar_chart(ax, data, variable)
-            elif chart_type == "Vertical Bar Chart":
-                self._create_vertical_bar_chart(ax, data, variable)
-            elif chart_type == "Pie Chart":
-                self._create_pie_chart(ax, data, variable)
-            elif chart_type == "Line Chart":
-                self._create_line_chart(ax, data, variable)
-            elif chart_type == "Area Chart":
-                self._create_area_chart(ax, data, variable)
-            elif chart_type == "Count Plot":
-                self._create_count_plot(ax, data, variable)
+            handler = self._chart_dispatch.get(chart_type)
+            if handler:
+                handler(ax, data, variable)
             
             # Set title
             ax.set_title(f"{chart_type} for {variable}", fontsize=12)
@@ -2779,22 +3002,62 @@ class FixedODKDashboardGUI:
             # Adjust layout
             fig.tight_layout()
             
-            # Embed in tkinter
-            canvas = FigureCanvasTkAgg(fig, self.chart_preview_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Add toolbar
-            toolbar_frame = ttk.Frame(self.chart_preview_frame)
-            toolbar_frame.pack(fill=tk.X)
-            toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
-            toolbar.update()
+            # Reset the toolbar's zoom/pan history for the new plot
+            if self._preview_toolbar is not None:
+                self._preview_toolbar.update()
+            self._preview_canvas.draw_idle()  # Let Tk coalesce redraws and paint once when idle
+            self._preview_key = preview_key
             
         except Exception as e:
-            for widget in self.chart_preview_frame.winfo_children():
-                widget.destroy()
+            self._reset_chart_preview()
             ttk.Label(self.chart_preview_frame, text=f"Error creating chart: {str(e)}").pack(pady=20)
             logging.error(f"Error creating chart preview: {e}")
+    
+    def _build_chart_preview(self):
+        """Create the preview figure, canvas and toolbar inside chart_preview_frame."""
+        global FigureCanvasTkAgg, NavigationToolbar2Tk
+        if FigureCanvasTkAgg is None:
+            _load_matplotlib()
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        
+        for widget in self.chart_preview_frame.winfo_children():
+            widget.destroy()
+        
+        self._preview_fig = Figure(figsize=(8, 4), dpi=100)
+        self._preview_ax = self._preview_fig.add_subplot(111)
+        
+        # Embed in tkinter
+        self._preview_canvas = FigureCanvasTkAgg(self._preview_fig, self.chart_preview_frame)
+        self._preview_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        if self.show_chart_toolbar.get():
+            self._toggle_chart_toolbar()
+    
+    def _toggle_chart_toolbar(self):
+        """Show or hide the preview toolbar, building it the first time it is shown."""
+        if self._preview_canvas is None:
+            return
+        
+        if not self.show_chart_toolbar.get():
+            if self._preview_toolbar_frame is not None:
+                self._preview_toolbar_frame.pack_forget()
+            return
+        
+        if self._preview_toolbar is None:
+            self._preview_toolbar_frame = ttk.Frame(self.chart_preview_frame)
+            self._preview_toolbar = NavigationToolbar2Tk(self._preview_canvas, self._preview_toolbar_frame)
+        self._preview_toolbar_frame.pack(fill=tk.X)
+    
+    def _reset_chart_preview(self):
+        """Destroy the preview widgets so the next preview rebuilds them."""
+        for widget in self.chart_preview_frame.winfo_children():
+            widget.destroy()
+        self._preview_fig = None
+        self._preview_ax = None
+        self._preview_canvas = None
+        self._preview_toolbar = None
+        self._preview_toolbar_frame = None
+        self._preview_key = None
 ##############################################################
     def load_choices_from_xlsform(xls_path):
         # assumes 'choices' sheet has columns: list_name, name, label
@@ -2811,14 +3074,44 @@ class FixedODKDashboardGUI:
             return self.analytics.form_info['choices'].get(variable)
         return None
 
+    def _counts(self, data, variable, value_labels=None):
+        """Return (cached) value counts of a column, optionally after mapping choice labels."""
+        key = (self._data_generation, variable, 'counts', bool(value_labels))
+        value_counts = self._agg_cache.get(key)
+        if value_counts is None:
+            column = data[variable]
+            if value_labels:
+                # Missing values stay missing (and uncounted) whatever the column dtype
+                column = column.map(lambda v: value_labels.get(str(v), str(v)), na_action='ignore')
+            value_counts = column.value_counts()
+            self._agg_cache[key] = value_counts
+        return value_counts
+
+    def _hist(self, data, variable, max_bins):
+        """Return (cached) np.histogram counts and bin edges for a numeric column."""
+        key = (self._data_generation, variable, 'hist', max_bins)
+        result = self._agg_cache.get(key)
+        if result is None:
+            # nunique() counts without materialising the array of unique values
+            result = np.histogram(data[variable].dropna(), bins=max(1, min(max_bins, data[variable].nunique())))
+            self._agg_cache[key] = result
+        return result
+
+    @staticmethod
+    def _rotate_xticklabels(ax):
+        """Slant the x tick labels of ax (plt.xticks would act on pyplot's current figure instead)."""
+        ax.tick_params(axis='x', labelrotation=45)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment('right')
+
     def _create_horizontal_bar_chart(self, ax, data, variable):
         value_labels = self._get_value_labels(variable)
-        column = data[variable]
-        if value_labels:
-            mapped = column.map(lambda v: value_labels.get(str(v), str(v)))
+        all_counts = self._counts(data, variable, value_labels)
+        # Select the top 15 with a heap instead of sorting every category
+        if len(all_counts) > 15:
+            value_counts = all_counts.nlargest(15).sort_values()
         else:
-            mapped = column
-        value_counts = mapped.value_counts().sort_values()
+            value_counts = all_counts.sort_values()
         value_counts.plot.barh(ax=ax, color='skyblue')
         ax.set_xlabel("Count")
         ax.set_ylabel(variable)
@@ -2826,8 +3119,9 @@ class FixedODKDashboardGUI:
         # Count values for categorical data or bin for numeric
         if data[variable].dtype.kind in 'ifc':  # integer, float, complex
             # Numeric data: create histogram
-            counts, bins = np.histogram(data[variable].dropna(), bins=min(10, len(data[variable].unique())))
-            bin_labels = [f"{bins[i]:.1f} - {bins[i+1]:.1f}" for i in range(len(bins)-1)]
+            counts, bins = self._hist(data, variable, 10)
+            edges = np.char.mod('%.1f', bins)
+            bin_labels = np.char.add(np.char.add(edges[:-1], " - "), edges[1:])
             y_pos = np.arange(len(bin_labels))
             ax.barh(y_pos, counts, align='center', color='skyblue')
             ax.set_yticks(y_pos)
@@ -2835,8 +3129,7 @@ class FixedODKDashboardGUI:
         else:
             # Categorical data: value counts
             # Limit to top 15 categories if too many
-            if len(value_counts) > 15:
-                value_counts = value_counts.tail(15)
+            if len(all_counts) > 15:
                 ax.set_title(f"Top 15 values for {variable}")
             value_counts.plot.barh(ax=ax, color='skyblue')
         
@@ -2853,21 +3146,22 @@ class FixedODKDashboardGUI:
         # Count values for categorical data or bin for numeric
         if data[variable].dtype.kind in 'ifc':  # integer, float, complex
             # Numeric data: create histogram
-            counts, bins = np.histogram(data[variable].dropna(), bins=min(10, len(data[variable].unique())))
-            bin_labels = [f"{bins[i]:.1f} - {bins[i+1]:.1f}" for i in range(len(bins)-1)]
+            counts, bins = self._hist(data, variable, 10)
+            edges = np.char.mod('%.1f', bins)
+            bin_labels = np.char.add(np.char.add(edges[:-1], " - "), edges[1:])
             x_pos = np.arange(len(bin_labels))
             ax.bar(x_pos, counts, align='center', color='skyblue')
             ax.set_xticks(x_pos)
             ax.set_xticklabels(bin_labels, rotation=45, ha='right')
         else:
             # Categorical data: value counts
-            value_counts = data[variable].value_counts()
+            value_counts = self._counts(data, variable)
             # Limit to top 15 categories if too many
             if len(value_counts) > 15:
                 value_counts = value_counts.head(15)
                 ax.set_title(f"Top 15 values for {variable}")
             value_counts.plot.bar(ax=ax, color='skyblue')
-            plt.xticks(rotation=45, ha='right')
+            self._rotate_xticklabels(ax)
         
         ax.set_ylabel("Count")
         ax.set_xlabel(variable)
@@ -2875,7 +3169,7 @@ class FixedODKDashboardGUI:
     def _create_pie_chart(self, ax, data, variable):
         """Create pie chart."""
         # Get value counts
-        value_counts = data[variable].value_counts()
+        value_counts = self._counts(data, variable)
         
         # Limit to top 8 categories + "Others" for readability
         if len(value_counts) > 8:
@@ -2894,10 +3188,19 @@ class FixedODKDashboardGUI:
         if data[variable].dtype.kind in 'ifc':  # integer, float, complex
             # Create a line chart of the distribution (density)
             try:
-                import scipy.stats as stats
-                kde = stats.gaussian_kde(data[variable].dropna())
-                x_range = np.linspace(data[variable].min(), data[variable].max(), 100)
-                density = kde(x_range)
+                key = (self._data_generation, variable, 'kde')
+                cached = self._agg_cache.get(key)
+                if cached is None:
+                    import scipy.stats as stats
+                    values = data[variable].dropna().to_numpy()
+                    # KDE evaluation is O(samples * points); a fixed-seed subsample keeps it bounded
+                    if values.size > 5000:
+                        values = np.random.default_rng(0).choice(values, 5000, replace=False)
+                    kde = stats.gaussian_kde(values)
+                    x_range = np.linspace(data[variable].min(), data[variable].max(), 100)
+                    cached = (x_range, kde(x_range))
+                    self._agg_cache[key] = cached
+                x_range, density = cached
                 ax.plot(x_range, density, 'b-')
                 ax.fill_between(x_range, density, alpha=0.3)
                 ax.set_xlabel(variable)
@@ -2908,34 +3211,34 @@ class FixedODKDashboardGUI:
                 data[variable].plot.line(ax=ax, color='blue')
         else:
             # For categorical, show a trend of counts
-            value_counts = data[variable].value_counts().sort_index()
+            value_counts = self._counts(data, variable).sort_index()
             value_counts.plot.line(ax=ax, marker='o')
             ax.set_xlabel(variable)
             ax.set_ylabel('Count')
-            plt.xticks(rotation=45, ha='right')
+            self._rotate_xticklabels(ax)
 
     def _create_area_chart(self, ax, data, variable):
         """Create area chart."""
         if data[variable].dtype.kind in 'ifc':  # integer, float, complex
             # Create bins and count
-            counts, bins = np.histogram(data[variable].dropna(), bins=min(15, len(data[variable].unique())))
-            bin_centers = [(bins[i] + bins[i+1])/2 for i in range(len(bins)-1)]
+            counts, bins = self._hist(data, variable, 15)
+            bin_centers = (bins[:-1] + bins[1:]) * 0.5
             ax.fill_between(bin_centers, counts, alpha=0.7, color='skyblue')
             ax.plot(bin_centers, counts, 'b-', alpha=0.7)
             ax.set_xlabel(variable)
             ax.set_ylabel('Count')
         else:
             # For categorical, show counts as area
-            value_counts = data[variable].value_counts().sort_index()
+            value_counts = self._counts(data, variable).sort_index()
             value_counts.plot.area(ax=ax, alpha=0.7, color='skyblue')
             ax.set_xlabel(variable)
             ax.set_ylabel('Count')
-            plt.xticks(rotation=45, ha='right')
+            self._rotate_xticklabels(ax)
 
     def _create_count_plot(self, ax, data, variable):
         """Create count plot with percentages."""
         # Get value counts and percentages
-        value_counts = data[variable].value_counts()
+        value_counts = self._counts(data, variable)
         total = len(data[variable].dropna())
         
         # Limit to top 10 categories if too many
@@ -2956,10 +3259,6 @@ class FixedODKDashboardGUI:
         
         ax.set_xlabel(variable)
         ax.set_ylabel('Count')
-        ####################################################################
-        ####################################################################
-        # Load saved settings if available
-        self.load_saved_settings()
     
     def browse_header_image(self):
         """Browse for high-quality header image file."""
@@ -2979,7 +3278,7 @@ class FixedODKDashboardGUI:
             self.update_image_preview()
             
             # Get and display image info
-            img_info = HighQualityImageProcessor.get_image_info(filename)
+            img_info = _cached_image_info(filename)
             if img_info:
                 format_info = img_info.get('format', 'Unknown')
                 size_info = f"{img_info.get('width', 0)}x{img_info.get('height', 0)}"
@@ -2995,59 +3294,74 @@ class FixedODKDashboardGUI:
     def clear_header_image(self):
         """Clear the selected header image."""
         self.header_image_path.set("")
+        _image_info_for_version.cache_clear()
+        _image_valid_for_version.cache_clear()
+        self._img_preview_cache.clear()
         self.clear_image_preview()
         self.image_info_label.config(text="")
         self.log_output("Header image cleared")
     
     def update_image_preview(self):
+        """Schedule a preview rebuild, coalescing calls that arrive within IMAGE_PREVIEW_DEBOUNCE_MS."""
+        if self._preview_after_id is not None:
+            self.root.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.root.after(self.IMAGE_PREVIEW_DEBOUNCE_MS, self._do_update_image_preview)
+    
+    def _do_update_image_preview(self):
         """Update the high-quality image preview."""
+        self._preview_after_id = None
         try:
             image_path = self.header_image_path.get()
-            if not image_path or not os.path.exists(image_path):
+            st = _safe_stat(image_path) if image_path else None
+            if st is None:
                 self.clear_image_preview()
                 return
             
-            # Clear existing preview
-            for widget in self.image_preview_frame.winfo_children():
-                widget.destroy()
-            
             # Get image info
-            img_info = HighQualityImageProcessor.get_image_info(image_path)
-            
-            # Create high-quality preview
-            preview_img = HighQualityImageProcessor.create_preview_image(image_path, max_size=(300, 150))
-            
-            if preview_img:
-                # Convert to PhotoImage
-                photo = ImageTk.PhotoImage(preview_img)
-                
-                # Create label with image
-                preview_label = ttk.Label(self.image_preview_frame, image=photo)
-                preview_label.image = photo  # Keep a reference
-                preview_label.pack(pady=5)
+            img_info = _cached_image_info(image_path, st)
+            
+            # Create high-quality preview, reusing the PhotoImage if this file was previewed before
+            preview_size = (300, 150)
+            cache_key = (image_path, st.st_mtime_ns, preview_size)
+            photo = self._img_preview_cache.get(cache_key)
+            if photo is not None:
+                self._img_preview_cache.move_to_end(cache_key)
+            else:
+                preview_img = HighQualityImageProcessor.create_preview_image(image_path, max_size=preview_size)
+                if preview_img:
+                    # Convert to PhotoImage
+                    photo = ImageTk.PhotoImage(preview_img)
+                    self._img_preview_cache[cache_key] = photo
+                    if len(self._img_preview_cache) > self.IMAGE_PREVIEW_CACHE_SIZE:
+                        self._img_preview_cache.popitem(last=False)
+            
+            if photo:
+                # Show the image in the persistent preview label
+                self._preview_img_label.configure(image=photo, text="")
+                self._preview_img_label.image = photo  # Keep a reference
                 
-                    # Create detailed info
+                # Create detailed info
+                info_text = ""
                 if img_info:
-                        format_name = img_info.get('format', 'Unknown')
-                        width = img_info.get('width', 0)
-                        height = img_info.get('height', 0)
-                        dpi = img_info.get('dpi', (72, 72))[0]
-                        file_size = img_info.get('file_size', 0) / 1024  # KB
-                        has_transparency = img_info.get('has_transparency', False)
-                        is_preferred = img_info.get('is_preferred_format', False)
-                        
-                        quality_indicator = "🟢 Excellent" if is_preferred and dpi >= 150 else "🟡 Good" if is_preferred else "🟠 Will optimize"
-                        transparency_info = " (with transparency)" if has_transparency else ""
-                        
-                        info_text = (f"📏 {width}×{height}px | 🎯 {dpi} DPI | 📁 {file_size:.1f}KB\n"
-                                   f"📸 {format_name}{transparency_info} | {quality_indicator}")
-                        
-                        info_label = ttk.Label(self.image_preview_frame, text=info_text, 
-                                             font=("Helvetica", 9), justify=tk.CENTER)
-                        info_label.pack(pady=5)
-                        
-                        # Update the info label
-                        self.image_info_label.config(text=f"{os.path.basename(image_path)} - {quality_indicator}")
+                    format_name = img_info.get('format', 'Unknown')
+                    width = img_info.get('width', 0)
+                    height = img_info.get('height', 0)
+                    dpi = img_info.get('dpi', (72, 72))[0]
+                    file_size = img_info.get('file_size', 0) / 1024  # KB
+                    has_transparency = img_info.get('has_transparency', False)
+                    is_preferred = img_info.get('is_preferred_format', False)
+                    
+                    quality_indicator = "🟢 Excellent" if is_preferred and dpi >= 150 else "🟡 Good" if is_preferred else "🟠 Will optimize"
+                    transparency_info = " (with transparency)" if has_transparency else ""
+                    
+                    info_text = (f"📏 {width}×{height}px | 🎯 {dpi} DPI | 📁 {file_size:.1f}KB\n"
+                               f"📸 {format_name}{transparency_info} | {quality_indicator}")
+                    
+                    # Update the info label
+                    self.image_info_label.config(text=f"{os.path.basename(image_path)} - {quality_indicator}")
+                self._preview_info_label.configure(text=info_text)
+            else:
+                self.clear_image_preview()
                 
         except Exception as e:
             self.log_output(f"Error loading image preview: {e}", "ERROR")
@@ -3055,20 +3369,47 @@ class FixedODKDashboardGUI:
     
     def clear_image_preview(self):
         """Clear the image preview."""
-        for widget in self.image_preview_frame.winfo_children():
-            widget.destroy()
-
-        no_image_label = ttk.Label(self.image_preview_frame, text="No image selected\n💡 Image\n✅ Handling")
-        no_image_label.pack(pady=20)
+        self._preview_img_label.configure(image="", text="No image selected\n💡 Image\n✅ Handling")
+        self._preview_img_label.image = None
+        self._preview_info_label.configure(text="")
         
     def log_output(self, message, level="INFO"):
-        """Add message to output text area."""
+        """Queue message for the output text area. Safe to call from worker threads."""
+        if self._closing:
+            return
         timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {level}: {message}\n"
+        self._log_queue.append(f"[{timestamp}] {level}: {message}\n")
+        # The text area only keeps the last LOG_MAX_LINES lines; the log file keeps the rest
+        _gui_logger.log(getattr(logging, level, logging.INFO), message)
+    
+    def _flush_log(self):
+        """Periodic Tk-thread callback writing all queued log lines with a single insert.
+        
+        Background tasks finished since the last tick are completed here as well.
+        """
+        self.root.after(self.LOG_FLUSH_INTERVAL_MS, self._flush_log)
+        while True:
+            try:
+                self._background_done(*self._done_queue.get_nowait())
+            except queue.Empty:
+                break
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if not lines:
+            return
+        
+        # Only follow the tail if the user is already looking at it; scrolled-back views are left
+        # alone so Tk does not have to lay out the end of the buffer on every flush
+        follow_tail = self.output_text.yview()[1] >= 1.0
+        self.output_text.insert(tk.END, ''.join(lines))
         
-        self.output_text.insert(tk.END, formatted_message)
-        self.output_text.see(tk.END)
-        self.root.update()
+        # Keep only the most recent lines so long sessions stay cheap to append to
+        line_count = int(self.output_text.index('end-1c').split('.')[0])
+        if line_count > self.LOG_MAX_LINES:
+            self.output_text.delete('1.0', f'{line_count - self.LOG_MAX_LINES}.0')
+        if follow_tail:
+            self.output_text.see(tk.END)
         
     def validate_inputs(self, check_form=False):
         """Validate user inputs."""
@@ -3088,12 +3429,75 @@ class FixedODKDashboardGUI:
         
         # Validate header image if provided
         header_image = self.header_image_path.get()
-        if header_image and not HighQualityImageProcessor.validate_image(header_image):
+        if header_image and not _cached_validate_image(header_image):
             messagebox.showerror("Error", "Selected header image is not valid or does not exist")
             return False
         
         return True
     
+    def _run_in_background(self, task, on_done=None):
+        """Run task on the GUI worker pool while the progress bar animates.
+        
+        The progress bar is started here and stopped from the Tk thread once the task finishes:
+        the worker only puts the finished future on _done_queue, which _flush_log drains. If
+        given, on_done(result) then runs on the Tk thread for any widget work the task needs.
+        """
+        self._active_tasks += 1
+        self.progress.start()
+        future = self._pool.submit(task)
+        future.add_done_callback(lambda f: self._done_queue.put((f, on_done)))
+    
+    def _background_done(self, future, on_done=None):
+        """Tk-thread completion callback for _run_in_background."""
+        if self._closing:
+            return
+        self._active_tasks -= 1
+        if not self._active_tasks:
+            self.progress.stop()
+        exc = future.exception()
+        if exc is not None:
+            self.log_output(f"❌ Unexpected error: {exc}", "ERROR")
+        elif on_done is not None and future.result() is not None:
+            on_done(future.result())
+    
+    def _get_client(self, force_refresh=False):
+        """Return an authenticated ODKCentralClient for the current connection fields.
+        
+        Clients are reused for CLIENT_TTL_SECONDS so consecutive actions share one login and one
+        HTTP session. Returns None if authentication fails.
+        """
+        key = (self.base_url.get(), self.username.get(), self.password.get(), int(self.project_id.get()))
+        with self._client_lock:
+            cached = self._client_cache.get(key)
+            if cached and not force_refresh and time.monotonic() - cached[1] < self.CLIENT_TTL_SECONDS:
+                return cached[0]
+            
+            client = ODKCentralClient(
+                base_url=key[0],
+                username=key[1],
+                password=key[2],
+                project_id=key[3]
+            )
+            if not client.authenticate():
+                self._client_cache.pop(key, None)
+                return None
+            
+            # Credentials are part of the key, so entries for old credentials are dropped here
+            self._client_cache = {key: (client, time.monotonic())}
+            return client
+    
+    def _get_forms(self, client, force_refresh=False):
+        """Return client.get_forms(), reusing a list fetched within FORMS_TTL_SECONDS."""
+        key = (client.base_url, client.project_id)
+        cached = self._forms_cache.get(key)
+        if cached and not force_refresh and time.monotonic() - cached[1] < self.FORMS_TTL_SECONDS:
+            return cached[0]
+        
+        forms = client.get_forms()
+        if forms:
+            self._forms_cache[key] = (forms, time.monotonic())
+        return forms
+    
     def test_connection(self):
         """Test connection to ODK Central."""
         if not self.validate_inputs():
@@ -3101,17 +3505,12 @@ class FixedODKDashboardGUI:
         
         def run_test():
             try:
-                self.progress.start()
                 self.log_output("Testing connection to ODK Central...")
                 
-                client = ODKCentralClient(
-                    base_url=self.base_url.get(),
-                    username=self.username.get(),
-                    password=self.password.get(),
-                    project_id=int(self.project_id.get())
-                )
+                # Always re-authenticate here; that is what the user is testing
+                client = self._get_client(force_refresh=True)
                 
-                if client.authenticate():
+                if client is not None:
                     projects = client.get_projects()
                     self.log_output(f"✅ Connection successful! Found {len(projects)} projects.", "SUCCESS")
                     
@@ -3126,12 +3525,8 @@ class FixedODKDashboardGUI:
                     
             except Exception as e:
                 self.log_output(f"❌ Connection failed: {str(e)}", "ERROR")
-            finally:
-                self.progress.stop()
         
-        thread = threading.Thread(target=run_test)
-        thread.daemon = True
-        thread.start()
+        self._run_in_background(run_test)
     
     def list_forms(self):
         """List available forms in the project."""
@@ -3140,18 +3535,13 @@ class FixedODKDashboardGUI:
         
         def run_list():
             try:
-                self.progress.start()
                 self.log_output("Fetching available forms...")
                 
-                client = ODKCentralClient(
-                    base_url=self.base_url.get(),
-                    username=self.username.get(),
-                    password=self.password.get(),
-                    project_id=int(self.project_id.get())
-                )
+                client = self._get_client()
                 
-                if client.authenticate():
-                    forms = client.get_forms()
+                if client is not None:
+                    # Explicit refresh: always fetch, then let the report actions reuse the result
+                    forms = self._get_forms(client, force_refresh=True)
                     if forms:
                         self.log_output(f"📋 Found {len(forms)} forms:", "SUCCESS")
                         for form in forms:
@@ -3166,171 +3556,30 @@ class FixedODKDashboardGUI:
                     
             except Exception as e:
                 self.log_output(f"❌ Error fetching forms: {str(e)}", "ERROR")
-            finally:
-                self.progress.stop()
         
-        thread = threading.Thread(target=run_list)
-        thread.daemon = True
-        thread.start()
+        self._run_in_background(run_list)
     
     def generate_dashboard(self):
         """Generate fixed high-quality dashboard report."""
-        if not self.validate_inputs(check_form=True):
-            return
-        
-        # Check dependencies
-        missing_deps = []
-        if not HAS_REPORTLAB:
-            missing_deps.append("reportlab")
-        if not HAS_MATPLOTLIB:
-            missing_deps.append("matplotlib")
-        
-        if missing_deps:
-            messagebox.showerror("Missing Dependencies", 
-                               f"Required packages not installed: {', '.join(missing_deps)}\n\n"
-                               f"Install with: pip install {' '.join(missing_deps)}")
-            return
-
-        def run_generation():
-            try:
-                self.progress.start()
-                self.log_output("🚀 Starting dashboard generation...")
-                
-                # Check header image
-                header_image = self.header_image_path.get() if self.header_image_path.get() else None
-                if header_image:
-                    if HighQualityImageProcessor.validate_image(header_image):
-                        img_info = HighQualityImageProcessor.get_image_info(header_image)
-                        format_name = img_info.get('format', 'Unknown')
-                        is_preferred = img_info.get('is_preferred_format', False)
-                        status = "high-quality" if is_preferred else "optimized"
-                        self.log_output(f"🖼️ Using {status} header image: {os.path.basename(header_image)} ({format_name})")
-                        self.log_output("✅ Fixed file handling - no more temp file errors!")
-                    else:
-                        self.log_output("⚠️ Warning: Header image invalid, proceeding without it", "WARNING")
-                        header_image = None
-
-                # Create client and authenticate
-                client = ODKCentralClient(
-                    base_url=self.base_url.get(),
-                    username=self.username.get(),
-                    password=self.password.get(),
-                    project_id=int(self.project_id.get())
-                )
-                
-                if not client.authenticate():
-                    self.log_output("❌ Authentication failed.", "ERROR")
-                    return
-                
-                self.log_output("✅ Authentication successful")
-                
-                # Download data
-                form_id = self.form_id.get()
-                self.log_output(f"📥 Downloading data for form: {form_id}")
-                
-                data = client.get_submissions(form_id)
-                
-                if data.empty:
-                    self.log_output("❌ No data found for the specified form.", "ERROR")
-                    return
-                
-                self.log_output(f"✅ Downloaded {len(data)} submissions with {len(data.columns)} fields")
-                
-                # Check for geopoint data
-                has_geopoints = False
-                for col in data.columns:
-                    if 'geopoint' in col.lower() or any(x in col.lower() for x in ['lat', 'lon', 'lng', 'longitude', 'latitude']):
-                        has_geopoints = True
-                        self.log_output(f"🗺️ Found geographic data in column: {col}")
-                        break
-                
-                # Get form info
-                forms = client.get_forms()
-                form_info = next((f for f in forms if f.get('xmlFormId') == form_id), {})
-                
-                # Create analytics and assign to self so the UI can read it
-                self.log_output("📊 Analyzing data...")
-                analytics = DashboardAnalytics(data, form_info)
-                self.analytics = analytics
-
-                # Populate the variable dropdown on the main/UI thread
-                if hasattr(self, 'root') and getattr(self, 'root') is not None:
-                    try:
-                        self.root.after(0, self.populate_variable_dropdown)
-                    except Exception:
-                        # Fallback - call directly (might be okay if already on main thread)
-                        self.populate_variable_dropdown()
-                else:
-                    # If no root available (unlikely), call directly
-                    self.populate_variable_dropdown()
-                
-                # Generate output path
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                reports_dir = Path("./reports")
-                reports_dir.mkdir(exist_ok=True)
-                
-                # Clean filename
-                safe_form_id = re.sub(r'[^\w\-_.]', '_', form_id)
-                output_path = reports_dir / f"dashboard_fixed_{safe_form_id}_{timestamp}.pdf"
-
-                # Generate high-quality report
-                self.log_output(f"📄 Generating PDF report: {output_path}")
-                reporter = FixedHighQualityDashboardPDFReporter(analytics, header_image)
-                
-                if reporter.generate_dashboard_report(str(output_path), self.report_title.get()):
-                    self.log_output(f"🎉 Dashboard report generated successfully!", "SUCCESS")
-                    self.log_output(f"📍 File saved: {output_path.absolute()}", "SUCCESS")
-                    self.log_output("✅ No more temporary file errors with header images", "SUCCESS")
-                    self.log_output("✨ Report features stable high-resolution images and optimized quality", "SUCCESS")
-                    
-                    if header_image:
-                        self.log_output("🖼️ High-quality header image included (300 DPI)", "SUCCESS")
-                    
-                    if has_geopoints and HAS_FOLIUM:
-                        self.log_output("🗺️ Geographic data visualization included in report", "SUCCESS")
-                        
-                        # Generate an HTML report with interactive maps if geopoints are found
-                        html_path = reports_dir / f"dashboard_fixed_{safe_form_id}_{timestamp}.html"
-                        if reporter.generate_html_report(str(html_path), self.report_title.get()):
-                            self.log_output(f"🌐 Interactive HTML report also generated: {html_path.name}", "SUCCESS")
-                    
-                    # Ask if user wants to open the file
-                    if messagebox.askyesno("Success", f"Dashboard report generated successfully!\n\nFile: {output_path.name}\n\nWould you like to open the report?"):
-                        import subprocess
-                        import platform
-                        
-                        try:
-                            if platform.system() == 'Windows':
-                                os.startfile(str(output_path))
-                            elif platform.system() == 'Darwin':  # macOS
-                                subprocess.run(['open', str(output_path)])
-                            else:  # Linux
-                                subprocess.run(['xdg-open', str(output_path)])
-                        except Exception as e:
-                            self.log_output(f"Could not open file automatically: {e}", "WARNING")
-                            
-                else:
-                    self.log_output("❌ Failed to generate dashboard report.", "ERROR")
-                    
-            except Exception as e:
-                self.log_output(f"❌ Error generating report: {str(e)}", "ERROR")
-                import traceback
-                self.log_output(f"Full error: {traceback.format_exc()}", "ERROR")
-            finally:
-                self.progress.stop()
-        
-        thread = threading.Thread(target=run_generation)
-        thread.daemon = True
-        thread.start()
+        self._start_report('pdf')
     
     def generate_html_report(self):
         """Generate HTML report with interactive maps."""
+        self._start_report('html')
+    
+    def _start_report(self, fmt):
+        """Validate inputs and dependencies, then build a 'pdf' or 'html' report in the background."""
         if not self.validate_inputs(check_form=True):
             return
         
         # Check dependencies
         missing_deps = []
-        if not HAS_FOLIUM:
+        if fmt == 'pdf':
+            if not HAS_REPORTLAB:
+                missing_deps.append("reportlab")
+            if not HAS_MATPLOTLIB:
+                missing_deps.append("matplotlib")
+        elif not HAS_FOLIUM:
             missing_deps.append("folium")
         
         if missing_deps:
@@ -3339,110 +3588,190 @@ class FixedODKDashboardGUI:
                                f"Install with: pip install {' '.join(missing_deps)}")
             return
         
-        def run_generation():
-            try:
-                self.progress.start()
+        self._run_in_background(lambda: self._run_report(fmt), self._report_done)
+    
+    def _run_report(self, fmt):
+        """Download the form data and write the report; runs on the worker pool.
+        
+        Returns (analytics, output_path, report_name) for _report_done once data was analysed,
+        with output_path None if the report itself failed; None if nothing was downloaded.
+        """
+        is_pdf = fmt == 'pdf'
+        report_name = "dashboard report" if is_pdf else "HTML report"
+        analytics = html_future = html_path = None
+        try:
+            if is_pdf:
+                self.log_output("🚀 Starting dashboard generation...")
+            else:
                 self.log_output("🌐 Starting HTML report generation...")
+            
+            # Check header image
+            header_image, img_info = self._resolve_header_image()
+            if header_image:
+                format_name = img_info.get('format', 'Unknown')
+                is_preferred = img_info.get('is_preferred_format', False)
+                status = "high-quality" if is_preferred else "optimized"
+                self.log_output(f"🖼️ Using {status} header image: {os.path.basename(header_image)} ({format_name})")
+                if is_pdf:
+                    self.log_output("✅ Fixed file handling - no more temp file errors!")
+            elif self.header_image_path.get():
+                self.log_output("⚠️ Warning: Header image invalid, proceeding without it", "WARNING")
+            
+            # Create client and authenticate
+            client = self._get_client()
+            
+            if client is None:
+                self.log_output("❌ Authentication failed.", "ERROR")
+                return
+            
+            self.log_output("✅ Authentication successful")
+            
+            # Download data
+            form_id = self.form_id.get()
+            self.log_output(f"📥 Downloading data for form: {form_id}")
+            
+            # The forms list is a small independent request; fetch it while the submissions download
+            forms_future = self._aux_pool.submit(self._get_forms, client)
+            
+            data = client.get_submissions(form_id)
+            
+            if data.empty:
+                self.log_output("❌ No data found for the specified form.", "ERROR")
+                return
+            
+            self.log_output(f"✅ Downloaded {len(data)} submissions with {len(data.columns)} fields")
+            
+            # Check for geopoint data
+            geo_col = next((col for col in data.columns if _GEO_COLUMN_RE.search(col)), None)
+            data.attrs['geo_col'] = geo_col
+            has_geopoints = geo_col is not None
+            if has_geopoints:
+                self.log_output(f"🗺️ Found geographic data in column: {geo_col}")
+            
+            # Get form info
+            forms = forms_future.result()
+            form_info = next((f for f in forms if f.get('xmlFormId') == form_id), {})
+            
+            # Create analytics; _report_done installs it on the Tk thread so the UI can read it
+            self.log_output("📊 Analyzing data...")
+            analytics = DashboardAnalytics(data, form_info)
+            
+            # Generate output path
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            reports_dir = Path("./reports")
+            reports_dir.mkdir(exist_ok=True)
+            
+            # Clean filename
+            safe_form_id = _FORM_ID_SANITIZE.sub('_', form_id)
+            output_path = reports_dir / f"dashboard_fixed_{safe_form_id}_{timestamp}.{fmt}"
+            
+            reporter = FixedHighQualityDashboardPDFReporter(analytics, header_image)
+            if is_pdf and has_geopoints and HAS_FOLIUM:
+                # The interactive HTML companion shares nothing with the PDF but the read-only
+                # analytics, so build it alongside on its own reporter
+                html_path = output_path.with_suffix('.html')
+                html_reporter = FixedHighQualityDashboardPDFReporter(analytics, header_image)
+                html_future = self._aux_pool.submit(html_reporter.generate_html_report, str(html_path),
+                                                    self.report_title.get())
+            
+            if is_pdf:
+                self.log_output(f"📄 Generating PDF report: {output_path}")
+                success = reporter.generate_dashboard_report(str(output_path), self.report_title.get())
+            else:
+                self.log_output(f"🌐 Generating HTML report: {output_path}")
+                success = reporter.generate_html_report(str(output_path), self.report_title.get())
+            
+            if not success:
+                self.log_output(f"❌ Failed to generate {report_name}.", "ERROR")
+                self._discard_html_companion(html_future, html_path)
+                return analytics, None, report_name
+            
+            self.log_output(f"🎉 {report_name[0].upper()}{report_name[1:]} generated successfully!", "SUCCESS")
+            self.log_output(f"📍 File saved: {output_path.absolute()}", "SUCCESS")
+            
+            if is_pdf:
+                self.log_output("✅ No more temporary file errors with header images", "SUCCESS")
+                self.log_output("✨ Report features stable high-resolution images and optimized quality", "SUCCESS")
                 
-                # Create client and authenticate
-                client = ODKCentralClient(
-                    base_url=self.base_url.get(),
-                    username=self.username.get(),
-                    password=self.password.get(),
-                    project_id=int(self.project_id.get())
-                )
-                
-                if not client.authenticate():
-                    self.log_output("❌ Authentication failed.", "ERROR")
-                    return
-                
-                self.log_output("✅ Authentication successful")
-                
-                # Download data
-                form_id = self.form_id.get()
-                self.log_output(f"📥 Downloading data for form: {form_id}")
-                
-                data = client.get_submissions(form_id)
-                
-                if data.empty:
-                    self.log_output("❌ No data found for the specified form.", "ERROR")
-                    return
-                
-                self.log_output(f"✅ Downloaded {len(data)} submissions with {len(data.columns)} fields")
-                
-                # Get form info
-                forms = client.get_forms()
-                form_info = next((f for f in forms if f.get('xmlFormId') == form_id), {})
+                if header_image:
+                    self.log_output("🖼️ High-quality header image included (300 DPI)", "SUCCESS")
                 
-                # Create analytics and store on self for UI access
-                self.log_output("📊 Analyzing data...")
-                analytics = DashboardAnalytics(data, form_info)
-                self.analytics = analytics
-
-                # Populate the variable dropdown on the main/UI thread
-                if hasattr(self, 'root') and getattr(self, 'root') is not None:
+                if html_future is not None:
+                    self.log_output("🗺️ Geographic data visualization included in report", "SUCCESS")
+                    
+                    # HTML report with interactive maps, generated concurrently with the PDF
                     try:
-                        self.root.after(0, self.populate_variable_dropdown)
-                    except Exception:
-                        self.populate_variable_dropdown()
-                else:
-                    self.populate_variable_dropdown()
-                
-                # Generate output path
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                reports_dir = Path("./reports")
-                reports_dir.mkdir(exist_ok=True)
-                
-                # Clean filename
-                safe_form_id = re.sub(r'[^\w\-_.]', '_', form_id)
-                output_path = reports_dir / f"dashboard_fixed_{safe_form_id}_{timestamp}.html"
-                
-                # Generate HTML report
-                self.log_output(f"🌐 Generating HTML report: {output_path}")
-                reporter = FixedHighQualityDashboardPDFReporter(analytics, self.header_image_path.get())
+                        html_ok = html_future.result()
+                    except Exception as e:
+                        html_ok = False
+                        self.log_output(f"⚠️ Interactive HTML report failed: {e}", "WARNING")
+                    if html_ok:
+                        self.log_output(f"🌐 Interactive HTML report also generated: {html_path.name}", "SUCCESS")
+            elif has_geopoints:
+                self.log_output("🗺️ Interactive map included with geopoint data", "SUCCESS")
+            
+            return analytics, output_path, report_name
                 
-                if reporter.generate_html_report(str(output_path), self.report_title.get()):
-                    self.log_output(f"🎉 HTML report generated successfully!", "SUCCESS")
-                    self.log_output(f"📍 File saved: {output_path.absolute()}", "SUCCESS")
-                    
-                    # Check for geopoint data
-                    has_geopoints = False
-                    for col in data.columns:
-                        if 'geopoint' in col.lower() or any(x in col.lower() for x in ['lat', 'lon', 'lng', 'longitude', 'latitude']):
-                            has_geopoints = True
-                            break
-                    
-                    if has_geopoints:
-                        self.log_output("🗺️ Interactive map included with geopoint data", "SUCCESS")
-                    
-                    # Ask if user wants to open the file
-                    if messagebox.askyesno("Success", f"HTML report generated successfully!\n\nFile: {output_path.name}\n\nWould you like to open the report?"):
-                        import subprocess
-                        import platform
-                        
-                        try:
-                            if platform.system() == 'Windows':
-                                os.startfile(str(output_path))
-                            elif platform.system() == 'Darwin':  # macOS
-                                subprocess.run(['open', str(output_path)])
-                            else:  # Linux
-                                subprocess.run(['xdg-open', str(output_path)])
-                        except Exception as e:
-                            self.log_output(f"Could not open file automatically: {e}", "WARNING")
-                            
-                else:
-                    self.log_output("❌ Failed to generate HTML report.", "ERROR")
-                    
-            except Exception as e:
-                self.log_output(f"❌ Error generating HTML report: {str(e)}", "ERROR")
-                import traceback
-                self.log_output(f"Full error: {traceback.format_exc()}", "ERROR")
-            finally:
-                self.progress.stop()
+        except Exception as e:
+            self.log_output(f"❌ Error generating {report_name}: {str(e)}", "ERROR")
+            self.log_output(f"Full error: {traceback.format_exc()}", "ERROR")
+            self._discard_html_companion(html_future, html_path)
+            return (analytics, None, report_name) if analytics is not None else None
+    
+    def _report_done(self, result):
+        """Tk-thread follow-up of _run_report: show the new data and offer to open the report."""
+        analytics, output_path, report_name = result
+        self.analytics = analytics
+        # Fill the variable dropdown from the frame just downloaded (this also drops stale aggregates)
+        self.populate_variable_dropdown(analytics.data)
         
-        thread = threading.Thread(target=run_generation)
-        thread.daemon = True
-        thread.start()
+        if output_path is not None and messagebox.askyesno(
+                "Success", f"{report_name[0].upper()}{report_name[1:]} generated successfully!\n\nFile: {output_path.name}\n\nWould you like to open the report?"):
+            self._open_report(output_path)
+    
+    def _discard_html_companion(self, html_future, html_path):
+        """Cancel the HTML companion of a failed PDF, or wait for it and remove the orphan file."""
+        if html_future is None or html_future.cancel():
+            return
+        try:
+            html_future.result()
+        except Exception as e:
+            self.log_output(f"⚠️ Interactive HTML report failed: {e}", "WARNING")
+        try:
+            html_path.unlink()
+        except OSError:
+            pass
+    
+    def _resolve_header_image(self):
+        """Return (path, image info) for the selected header image, or (None, {}) if none or invalid.
+        
+        Validation and info share the per-file caches, so validate_inputs, this call and the
+        reporter together open the file once per click.
+        """
+        header_image = self.header_image_path.get()
+        if not header_image or not _cached_validate_image(header_image):
+            return None, {}
+        return header_image, _cached_image_info(header_image)
+    
+    def _open_report(self, output_path):
+        """Open a generated report with the platform's default application."""
+        try:
+            open_cmd = _OPEN_CMD.get(_PLATFORM, ['xdg-open'])
+            if open_cmd is None:
+                os.startfile(str(output_path))
+            else:
+                subprocess.run([*open_cmd, str(output_path)])
+        except Exception as e:
+            self.log_output(f"Could not open file automatically: {e}", "WARNING")
+    
+    def _encoded_password(self):
+        """Return the base64-encoded password field, re-encoding only when the password changed."""
+        password = self.password.get().encode()
+        digest = hashlib.blake2b(password, digest_size=16).digest()
+        if digest != self._last_pw_hash:
+            self._cached_b64 = base64.b64encode(password).decode()
+            self._last_pw_hash = digest
+        return self._cached_b64
     
     def save_settings(self):
         """Save current settings to file."""
@@ -3452,8 +3781,7 @@ class FixedODKDashboardGUI:
             if hasattr(self, 'remember_password') and self.remember_password.get():
                 try:
                     # Simple encryption - not highly secure but better than plaintext
-                    import base64
-                    password_to_save = base64.b64encode(self.password.get().encode()).decode()
+                    password_to_save = self._encoded_password()
                 except Exception:
                     # If encryption fails, don't save password
                     password_to_save = ""
@@ -3476,8 +3804,7 @@ class FixedODKDashboardGUI:
             )
             
             if filename:
-                with open(filename, 'w') as f:
-                    json.dump(settings, f, indent=2)
+                _write_settings_file(filename, settings)
                 self.log_output(f"💾 Settings saved to {filename}", "SUCCESS")
                 
         except Exception as e:
@@ -3492,8 +3819,7 @@ class FixedODKDashboardGUI:
             )
             
             if filename:
-                with open(filename, 'r') as f:
-                    settings = json.load(f)
+                settings = _read_settings_file(filename)
                 
                 self.base_url.set(settings.get('base_url', ''))
                 self.username.set(settings.get('username', ''))
@@ -3502,7 +3828,6 @@ class FixedODKDashboardGUI:
                 if 'password' in settings and settings.get('password') and settings.get('remember_password', False):
                     try:
                         # Simple decryption
-                        import base64
                         decoded_password = base64.b64decode(settings.get('password').encode()).decode()
                         self.password.set(decoded_password)
                     except Exception:
@@ -3528,40 +3853,28 @@ class FixedODKDashboardGUI:
         except Exception as e:
             self.log_output(f"❌ Error loading settings: {str(e)}", "ERROR")
     
-    def load_saved_settings(self):
-        """Load automatically saved settings."""
-        try:
-            settings_file = Path.home() / '.odk_dashboard_fixed_settings.json'
-            if settings_file.exists():
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
-                
-                self.base_url.set(settings.get('base_url', 'https://'))
-                self.username.set(settings.get('username', ''))
-                self.project_id.set(settings.get('project_id', ''))
-                self.form_id.set(settings.get('form_id', ''))
-                self.report_title.set(settings.get('report_title', 'ODK Central Dashboard Report'))
-                self.header_image_path.set(settings.get('header_image_path', ''))
-                
-                # Update image preview if path exists
-                if self.header_image_path.get():
-                    self.update_image_preview()
-                else:
-                    self.clear_image_preview()
-                
-        except Exception:
-            pass  # Ignore errors loading auto-saved settings
+    def _mark_settings_dirty(self, *_):
+        self._settings_dirty = True
+        # Auto-save once the edits pause instead of on every keystroke
+        if self._settings_after_id is not None:
+            self.root.after_cancel(self._settings_after_id)
+        self._settings_after_id = self.root.after(self.SETTINGS_SAVE_DEBOUNCE_MS, self._debounced_save_settings)
+    
+    def _debounced_save_settings(self):
+        self._settings_after_id = None
+        self.save_auto_settings()
     
     def save_auto_settings(self):
         """Automatically save settings including password if enabled."""
+        if not self._settings_dirty:
+            return
         try:
             # Encrypt password if remember password is checked
             password_to_save = ""
             if hasattr(self, 'remember_password') and self.remember_password.get():
                 try:
                     # Simple encryption - not highly secure but better than plaintext
-                    import base64
-                    password_to_save = base64.b64encode(self.password.get().encode()).decode()
+                    password_to_save = self._encoded_password()
                 except Exception:
                     # If encryption fails, don't save password
                     password_to_save = ""
@@ -3578,8 +3891,8 @@ class FixedODKDashboardGUI:
             }
             
             settings_file = Path.home() / '.odk_dashboard_fixed_settings.json'
-            with open(settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+            _write_settings_file(settings_file, settings)
+            self._settings_dirty = False
                 
         except Exception as e:
             logging.error(f"Error saving auto settings: {e}")
@@ -3589,8 +3902,7 @@ class FixedODKDashboardGUI:
         try:
             settings_file = Path.home() / '.odk_dashboard_fixed_settings.json'
             if settings_file.exists():
-                with open(settings_file, 'r') as f:
-                    settings = json.load(f)
+                settings = _read_settings_file(settings_file)
                 
                 self.base_url.set(settings.get('base_url', 'https://'))
                 self.username.set(settings.get('username', ''))
@@ -3599,7 +3911,6 @@ class FixedODKDashboardGUI:
                 if 'password' in settings and settings.get('password') and settings.get('remember_password', False):
                     try:
                         # Simple decryption
-                        import base64
                         decoded_password = base64.b64decode(settings.get('password').encode()).decode()
                         self.password.set(decoded_password)
                     except Exception:
@@ -3626,30 +3937,51 @@ class FixedODKDashboardGUI:
     
     def on_closing(self):
         """Handle application closing."""
+        # Save now rather than waiting for a pending debounced save
+        if self._settings_after_id is not None:
+            self.root.after_cancel(self._settings_after_id)
+            self._settings_after_id = None
         self.save_auto_settings()
-        # Clean up any remaining temp files
-        cleanup_temp_files()
+        # Drop queued work; a task already running finishes on its own daemon thread without
+        # touching the UI once _closing is set
+        self._closing = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._aux_pool.shutdown(wait=False, cancel_futures=True)
+        # Remaining temp files are removed by the atexit hook
         self.root.destroy()
 # ============================================================================
 # Dependency Checking and Main Application
 # ============================================================================
 
+@functools.lru_cache(maxsize=1)
 def check_dependencies():
-    """Check and report missing dependencies."""
+    """Check and report missing dependencies.
+    
+    Returns (missing, optional, pillow_version) with tuples for the two lists; installed
+    packages do not change during a run, so the result is computed once.
+    """
     missing_deps = []
     optional_deps = []
     
     # Required dependencies
+    if not HAS_PANDAS:
+        missing_deps.append("pandas")
+    if not HAS_NUMPY:
+        missing_deps.append("numpy")
     if not HAS_REPORTLAB:
         missing_deps.append("reportlab")
     
-    # Check for Pillow specifically
-    try:
-        import PIL
-        PIL_VERSION = PIL.__version__
-    except ImportError:
-        missing_deps.append("Pillow")
-        PIL_VERSION = "Not installed"
+    # Check for Pillow specifically; it is normally already loaded by the module imports
+    pil = sys.modules.get('PIL')
+    if pil is not None:
+        PIL_VERSION = pil.__version__
+    else:
+        # Ask the installed distribution metadata instead of importing the package
+        try:
+            PIL_VERSION = importlib.metadata.version("Pillow")
+        except importlib.metadata.PackageNotFoundError:
+            missing_deps.append("Pillow")
+            PIL_VERSION = "Not installed"
     
     # Optional but recommended dependencies
     if not HAS_MATPLOTLIB:
@@ -3661,28 +3993,44 @@ def check_dependencies():
     if not HAS_FOLIUM:
         optional_deps.append("folium")
     
-    return missing_deps, optional_deps, PIL_VERSION
+    return tuple(missing_deps), tuple(optional_deps), PIL_VERSION
 
 def main():
     """Main application entry point."""
-    # Update constants with current values
-    global CURRENT_USER, CURRENT_DATETIME
-    CURRENT_USER = os.getlogin()
-    CURRENT_DATETIME = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
-    # Setup logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('odk_dashboard_fixed.log'),
-            logging.StreamHandler()
-        ]
-    )
+    # Setup logging. Callers (including the Tk thread) only enqueue records; a listener
+    # thread does the file and console writes
+    log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    console_handler = logging.StreamHandler()
+    # Output-pane lines are mirrored to the log file only; the console already has the window
+    console_handler.addFilter(lambda record: record.name != _gui_logger.name)
+    log_handlers = [
+        logging.handlers.RotatingFileHandler('odk_dashboard_fixed.log', maxBytes=5 * 1024 * 1024,
+                                             backupCount=3, encoding='utf-8'),
+        console_handler
+    ]
+    for handler in log_handlers:
+        handler.setFormatter(log_formatter)
+    log_queue = queue.SimpleQueue()
+    log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+    log_listener.start()
+    # Flushes whatever is still queued once the interpreter exits, however the app ends.
+    # atexit runs hooks last-in first-out, so re-register the temp file cleanup to keep
+    # its warnings ahead of the listener shutdown
+    atexit.register(log_listener.stop)
+    atexit.unregister(cleanup_temp_files)
+    atexit.register(cleanup_temp_files)
+    logging.basicConfig(level=logging.INFO, handlers=[logging.handlers.QueueHandler(log_queue)])
     
     # Check dependencies
     missing_deps, optional_deps, pil_version = check_dependencies()
     
+    # Load tkinter once for both the error dialogs and the application
+    try:
+        _load_tkinter()
+        tk_import_error = None
+    except ImportError as e:
+        tk_import_error = e
+    
     if missing_deps:
         print("❌ Missing required dependencies:")
         for dep in missing_deps:
@@ -3690,21 +4038,18 @@ def main():
         print(f"\nInstall with: pip install {' '.join(missing_deps)}")
         
         # Try to show GUI error if tkinter is available
-        try:
-            import tkinter as tk
-            from tkinter import messagebox
-            root = tk.Tk()
-            root.withdraw()  # Hide the main window
-            messagebox.showerror(
-                "Missing Dependencies", 
-                f"Required packages not installed:\n{', '.join(missing_deps)}\n\n"
-                f"Install with: pip install {' '.join(missing_deps)}"
-            )
-            root.destroy()
-        except ImportError:
-            pass  # tkinter not available
-        except Exception as e:
-            print(f"Could not show GUI error: {e}")
+        if tk_import_error is None:
+            try:
+                root = tk.Tk()
+                root.withdraw()  # Hide the main window
+                messagebox.showerror(
+                    "Missing Dependencies", 
+                    f"Required packages not installed:\n{', '.join(missing_deps)}\n\n"
+                    f"Install with: pip install {' '.join(missing_deps)}"
+                )
+                root.destroy()
+            except Exception as e:
+                print(f"Could not show GUI error: {e}")
         
         return 1
     
@@ -3719,8 +4064,9 @@ def main():
     
     # Create main application
     try:
-        # Import tkinter here to ensure it's available
-        import tkinter as tk
+        if tk_import_error is not None:
+            raise tk_import_error
+        _load_pandas()
         root = tk.Tk()
         
         # Set application icon if available
@@ -3741,10 +4087,13 @@ def main():
         app.clear_image_preview()
         
         logging.info("ODK Central Dashboard Reporter started")
-        print("\033[92m🚀 ODK Central Dashboard Reporter\033[0m")
+        if _STDOUT_IS_TTY:
+            print("\033[92m🚀 ODK Central Dashboard Reporter\033[0m")
+        else:
+            print("🚀 ODK Central Dashboard Reporter")
         print("✅ Temporary file handling for header images!")
         print("📊 Generate professional dashboard reports from ODK Central data")
-        print(f"📅 Version 2.2.1 | {CURRENT_DATETIME} UTC | User: {CURRENT_USER}")
+        print(f"📅 Version 2.2.1 | {current_datetime_str()} UTC | User: {CURRENT_USER}")
         print()
         
         # Start the application
@@ -3766,9 +4115,7 @@ def main():
         print(f"❌ {error_msg}")
         
         try:
-            import tkinter as tk_error
-            from tkinter import messagebox
-            root_error = tk_error.Tk()
+            root_error = tk.Tk()
             root_error.withdraw()
             messagebox.showerror("Startup Error", error_msg)
             root_error.destroy()
@@ -3777,16 +4124,28 @@ def main():
         
         return 1
 
-def cli_mode():
-    """Command line interface mode for fixed high-quality headless operation."""
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the CLI argument parser once (shared by cli_mode and the --help path)."""
     import argparse
     
-    # Update constants with current values
-    global CURRENT_USER, CURRENT_DATETIME
-    CURRENT_USER = os.getlogin()
-    CURRENT_DATETIME = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Range/set checks as argparse types instead of choices= lists that argparse scans and prints
+    def _quality(value):
+        quality = int(value)
+        if not 70 <= quality <= 100:
+            raise argparse.ArgumentTypeError(f"image quality must be between 70 and 100 (got {quality})")
+        return quality
+    
+    allowed_dpi = frozenset({150, 200, 300, 600})
     
-    parser = argparse.ArgumentParser(description='ODK Central Dashboard Reporter')
+    def _dpi(value):
+        dpi = int(value)
+        if dpi not in allowed_dpi:
+            raise argparse.ArgumentTypeError(f"image DPI must be one of 150, 200, 300, 600 (got {dpi})")
+        return dpi
+    
+    parser = argparse.ArgumentParser(description='ODK Central Dashboard Reporter',
+                                     fromfile_prefix_chars='@')
     parser.add_argument('--url', required=True, help='ODK Central base URL')
     parser.add_argument('--username', required=True, help='Username')
     parser.add_argument('--password', required=True, help='Password')
@@ -3795,14 +4154,17 @@ def cli_mode():
     parser.add_argument('--output', help='Output PDF path')
     parser.add_argument('--title', default='ODK Central Dashboard Report', help='Report title')
     parser.add_argument('--header-image', help='Path to header image file (PNG/JPG preferred)')
-    parser.add_argument('--image-quality', type=int, default=95, choices=range(70, 101), 
+    parser.add_argument('--image-quality', type=_quality, default=95,
                        help='JPEG quality (70-100, default: 95)')
-    parser.add_argument('--image-dpi', type=int, default=300, choices=[150, 200, 300, 600],
-                       help='Target DPI for images (default: 300)')
+    parser.add_argument('--image-dpi', type=_dpi, default=300,
+                       help='Target DPI for images (150, 200, 300 or 600, default: 300)')
     parser.add_argument('--html', action='store_true', help='Generate HTML report with interactive map')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
-    
-    args = parser.parse_args()
+    return parser
+
+def cli_mode():
+    """Command line interface mode for fixed high-quality headless operation."""
+    args = _build_parser().parse_args()
     
     # Setup logging
     level = logging.DEBUG if args.verbose else logging.INFO
@@ -3815,6 +4177,8 @@ def cli_mode():
         print(f"Install with: pip install {' '.join(missing_deps)}")
         return 1
     
+    _load_pandas()
+    
     try:
         print("🚀 Starting ODK Central Dashboard Reporter")
         print(f"✅ High-quality image processing (Pillow {pil_version})")
@@ -3841,12 +4205,11 @@ def cli_mode():
         print(f"✅ Downloaded {len(data)} submissions with {len(data.columns)} fields")
         
         # Check for geopoint data
-        has_geopoints = False
-        for col in data.columns:
-            if 'geopoint' in col.lower() or any(x in col.lower() for x in ['lat', 'lon', 'lng', 'longitude', 'latitude']):
-                has_geopoints = True
-                print(f"🗺️ Found geographic data in column: {col}")
-                break
+        geo_col = next((col for col in data.columns if _GEO_COLUMN_RE.search(col)), None)
+        data.attrs['geo_col'] = geo_col
+        has_geopoints = geo_col is not None
+        if has_geopoints:
+            print(f"🗺️ Found geographic data in column: {geo_col}")
         
         # Get form info
         forms = client.get_forms()
@@ -3861,7 +4224,7 @@ def cli_mode():
             output_path = Path(args.output)
         else:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_form_id = re.sub(r'[^\w\-_.]', '_', args.form_id)
+            safe_form_id = _FORM_ID_SANITIZE.sub('_', args.form_id)
             output_path = Path(f"dashboard_fixed_{safe_form_id}_{timestamp}.pdf")
         
         # Ensure output directory exists
@@ -3917,7 +4280,6 @@ def cli_mode():
     except Exception as e:
         print(f"❌ Error: {e}")
         if args.verbose:
-            import traceback
             print(traceback.format_exc())
         return 1
 
@@ -3943,11 +4305,14 @@ def print_usage_examples():
     print("     --html \\")
     print("     --verbose")
     print()
+    print("📝 Reusing arguments from a file (one argument per line):")
+    print("   python odk_dashboard_reporter_fixed.py @myjob.cfg --form-id your-form-id")
+    print()
     print("📦 Required Dependencies:")
     print("   pip install reportlab Pillow pandas requests matplotlib seaborn numpy python-dateutil")
     print()
     print("🔧 Optional Dependencies:")
-    print("   pip install pyyaml tqdm folium")
+    print("   pip install pyyaml tqdm folium PyTurboJPEG orjson")
     print()
     print("✅ Fixed Issues:")
     print("   • Fixed temporary file deletion causing ReportLab errors")
@@ -3958,18 +4323,15 @@ def print_usage_examples():
     print()
 
 if __name__ == '__main__':
-    import sys
-    
-    # Update constants with current values
-    CURRENT_USER = os.getlogin() 
-    CURRENT_DATETIME = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    
     # Print header
-    print("=" * 90)
-    print("🚀 Dashboard Reporter ")
-    print(f"📅 Version 2.2.1 | {CURRENT_DATETIME} UTC | User: {CURRENT_USER}")
-    print("=" * 90)
-    print()
+    if _STDOUT_IS_TTY:
+        print("=" * 90)
+        print("🚀 Dashboard Reporter ")
+        print(f"📅 Version 2.2.1 | {current_datetime_str()} UTC | User: {CURRENT_USER}")
+        print("=" * 90)
+        print()
+    else:
+        print("ODK Dashboard Reporter v2.2.1")
     
     # Check if running in CLI mode (has command line arguments other than help)
     if len(sys.argv) > 1 and not any(arg in sys.argv for arg in ['--help', '-h']):
@@ -3979,19 +4341,17 @@ if __name__ == '__main__':
             sys.exit(exit_code)
         except KeyboardInterrupt:
             print("\n⚠️ Operation cancelled by user")
-            # Clean up temp files on interrupt
-            cleanup_temp_files()
             sys.exit(1)
         except SystemExit:
             raise
         except Exception as e:
             print(f"❌ CLI Error: {e}")
-            cleanup_temp_files()
             sys.exit(1)
     elif '--help' in sys.argv or '-h' in sys.argv:
         # Show help
         print_usage_examples()
-        cli_mode()  # This will show argparse help
+        _build_parser().print_help()
+        sys.exit(0)
     else:
         # GUI mode
         try:
@@ -3999,13 +4359,10 @@ if __name__ == '__main__':
             sys.exit(exit_code)
         except KeyboardInterrupt:
             print("\n⚠️ Application closed by user")
-            cleanup_temp_files()
             sys.exit(0)
         except SystemExit:
             raise
         except Exception as e:
             print(f"❌ GUI Error: {e}")
-            import traceback
             traceback.print_exc()
-            cleanup_temp_files()
             sys.exit(1)
\ No newline at end of file